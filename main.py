@@ -5,13 +5,19 @@ Automatische Generierung von SEO-optimierten deutschen Texten mit KI-Unterstütz
 """
 
 import argparse
+import hashlib
+import logging
 import sys
-import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set, Tuple
 
 from src.utils.config import Config
 from src.utils.logger import setup_logger
+from src.utils.json_utils import dumps_bytes
+from src.utils.slug import cached_slugify
+from src.utils.semantic_cache import SemanticCache
 from src.analyzer.competitor_analyzer import CompetitorAnalyzer
 from src.scorer.content_scorer import ContentScorer
 from src.generator.text_generator import TextGenerator
@@ -21,15 +27,28 @@ from src.utils.html_builder import HTMLBuilder
 from src.utils.report_generator import ReportGenerator
 
 
+OUTPUT_DIR = Path("data/outputs")
+HISTORY_DIR = Path("data/history")
+
+
 class SEOContentGenerator:
     """Hauptklasse für den SEO Content Generator"""
     
-    def __init__(self, config_path: str = "config.json"):
+    # Bereits angelegte Lauf-Verzeichnisse (vermeidet wiederholte mkdir-Aufrufe)
+    _created_dirs: Set[Path] = set()
+    
+    def __init__(self, config_path: str = "config.json", use_cache: bool = True):
         """Initialisiere den Generator mit Konfiguration"""
         self.config = Config(config_path)
+        if not use_cache:
+            self.config.set("cache.enabled", False)
         self.logger = setup_logger(self.config)
         self.logger.info("SEO Content Generator gestartet")
         
+        # Ausgabe-Verzeichnisse einmalig anlegen
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+        
         # Module initialisieren
         self.competitor_analyzer = CompetitorAnalyzer(self.config)
         self.content_scorer = ContentScorer(self.config)
@@ -38,6 +57,21 @@ class SEOContentGenerator:
         self.meta_generator = MetaGenerator(self.config)
         self.html_builder = HTMLBuilder(self.config)
         self.report_generator = ReportGenerator(self.config)
+        
+        # Score-Cache pro Lauf (Text-Hash → Scoring-Ergebnis)
+        self._score_cache = {}
+        
+        # Cache früherer Läufe für ähnliche Keywords
+        self.run_cache = None
+        if self.config.get("cache.enabled", True):
+            cache_dir = Path(self.config.get("cache.directory", "data/cache"))
+            self.run_cache = SemanticCache(
+                str(cache_dir / "runs"),
+                threshold=self.config.get("cache.run_similarity", 0.92),
+                max_entries=self.config.get("cache.max_entries", 500),
+                model_name=self.config.get("cache.embedding_model", "all-MiniLM-L6-v2"),
+                flush_interval=self.config.get("cache.flush_interval_ms", 5000) / 1000
+            )
     
     def generate_content(
         self,
@@ -62,7 +96,12 @@ class SEOContentGenerator:
         Returns:
             dict: Ergebnis mit generiertem Content und Metriken
         """
-        self.logger.info(f"Starte Content-Generierung für Keyword: '{keyword}'")
+        self.logger.info("Starte Content-Generierung für Keyword: '%s'", keyword)
+        
+        # Einheitlicher Slug und Zeitstempel für alle Dateien dieses Laufs
+        run_slug = cached_slugify(keyword)
+        run_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._score_cache = {}
         
         # Phase 1: Konkurrenzanalyse
         self.logger.info("Phase 1: Analysiere Top 5 Google-Rankings...")
@@ -72,74 +111,73 @@ class SEOContentGenerator:
             self.logger.error("Keine Konkurrenz-Daten gefunden")
             return {"success": False, "error": "Konkurrenzanalyse fehlgeschlagen"}
         
-        self.logger.info(f"✓ {len(competitor_data['competitors'])} Konkurrenten analysiert")
-        
-        # Phase 2: Ersten Text-Entwurf generieren
-        self.logger.info("Phase 2: Generiere ersten Text-Entwurf...")
-        
-        generation_params = {
-            "keyword": keyword,
-            "content_type": content_type,
-            "competitor_data": competitor_data,
-            "word_count": word_count or self.config.get("content.word_count_min", 1000)
-        }
+        self.logger.info("✓ %d Konkurrenten analysiert", len(competitor_data['competitors']))
         
-        draft_text = self.text_generator.generate(generation_params)
-        self.logger.info(f"✓ Entwurf erstellt ({len(draft_text.split())} Wörter)")
+        # Phase 2-4: Wiederverwendung eines früheren Laufs mit ausreichendem Score
+        # Wortanzahl und Konkurrenz-Set müssen exakt übereinstimmen (nur das Keyword wird ähnlich gesucht)
+        run_key = keyword
+        competitor_urls = "\n".join(sorted(c.get('url', '') for c in competitor_data['competitors']))
+        competitor_hash = hashlib.blake2b(competitor_urls.encode("utf-8"), digest_size=16).hexdigest()
+        run_scope = f"run|{content_type}|{word_count}|{competitor_hash}"
+        cached_run = self.run_cache.get(run_key, scope=run_scope) if self.run_cache is not None else None
         
-        # Phase 3: Content Score berechnen
-        self.logger.info("Phase 3: Berechne Content Score...")
-        score_result = self.content_scorer.score(draft_text, keyword, competitor_data)
-        current_score = score_result['total_score']
-        self.logger.info(f"✓ Aktueller Score: {current_score}/100")
+        # Treffer kann von einem ähnlichen Keyword stammen: für das aktuelle Keyword neu bewerten
+        cached_score = None
+        if cached_run is not None:
+            cached_score = self._score(cached_run['text'], keyword, competitor_data)
+            if cached_score['total_score'] < target_score:
+                self.logger.info(
+                    "Früherer Lauf verworfen (Score für '%s': %s/100 < %s)",
+                    keyword, cached_score['total_score'], target_score
+                )
+                cached_score = None
         
-        # Phase 4: Iterative Optimierung
-        iteration = 1
-        max_iterations = self.config.get("scoring.max_iterations", 5)
-        optimized_text = draft_text
+        if cached_score is not None:
+            self.logger.info(
+                "✓ Früherer Lauf wiederverwendet (Score: %s/100), überspringe Phase 2-4",
+                cached_score['total_score']
+            )
+            optimized_text = cached_run['text']
+            score_result = cached_score
+            current_score = cached_score['total_score']
+            iterations = 0
+        else:
+            optimized_text, score_result, current_score, iterations = self._draft_and_optimize(
+                keyword,
+                content_type,
+                target_score,
+                word_count,
+                competitor_data
+            )
         
-        while current_score < target_score and iteration <= max_iterations:
-            self.logger.info(f"Phase 4.{iteration}: Optimiere Text (Score: {current_score} → Ziel: {target_score})...")
-            
-            # Optimierungsvorschläge generieren
-            suggestions = self.content_scorer.get_improvement_suggestions(score_result)
-            
-            # Text optimieren
-            optimized_text = self.text_generator.optimize(
+        # Phase 5 + 6: Meta-Daten und Bilder parallel generieren (unabhängige API-Aufrufe)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.logger.info("Phase 5: Generiere Meta-Daten...")
+            meta_future = executor.submit(
+                self.meta_generator.generate,
                 optimized_text,
-                suggestions,
-                generation_params
+                keyword,
+                content_type
             )
             
-            # Neuen Score berechnen
-            score_result = self.content_scorer.score(optimized_text, keyword, competitor_data)
-            new_score = score_result['total_score']
+            images_future = None
+            if generate_images:
+                self.logger.info("Phase 6: Generiere %d Bilder...", image_count)
+                images_future = executor.submit(
+                    self.image_generator.generate,
+                    keyword,
+                    optimized_text,
+                    content_type,
+                    count=image_count
+                )
             
-            self.logger.info(f"✓ Score verbessert: {current_score} → {new_score}")
+            meta_data = meta_future.result()
+            self.logger.info("✓ Meta-Daten erstellt (Title, Description, H1)")
             
-            if new_score <= current_score:
-                self.logger.warning("Keine Verbesserung, breche Optimierung ab")
-                break
-            
-            current_score = new_score
-            iteration += 1
-        
-        # Phase 5: Meta-Daten generieren
-        self.logger.info("Phase 5: Generiere Meta-Daten...")
-        meta_data = self.meta_generator.generate(optimized_text, keyword, content_type)
-        self.logger.info("✓ Meta-Daten erstellt (Title, Description, H1)")
-        
-        # Phase 6: Bilder generieren (optional)
-        images = []
-        if generate_images:
-            self.logger.info(f"Phase 6: Generiere {image_count} Bilder...")
-            images = self.image_generator.generate(
-                keyword,
-                optimized_text,
-                content_type,
-                count=image_count
-            )
-            self.logger.info(f"✓ {len(images)} Bilder generiert")
+            images = []
+            if images_future is not None:
+                images = images_future.result()
+                self.logger.info("✓ %d Bilder generiert", len(images))
         
         # Phase 7: HTML-Output erstellen
         self.logger.info("Phase 7: Erstelle HTML-Output...")
@@ -152,8 +190,8 @@ class SEOContentGenerator:
         )
         
         # Speichern
-        output_path = self._save_output(keyword, html_output, optimized_text, meta_data)
-        self.logger.info(f"✓ Output gespeichert: {output_path}")
+        output_path = self._save_output(run_slug, run_timestamp, html_output, optimized_text, meta_data)
+        self.logger.info("✓ Output gespeichert: %s", output_path)
         
         # Phase 8: Report generieren
         self.logger.info("Phase 8: Generiere Report...")
@@ -164,11 +202,14 @@ class SEOContentGenerator:
             competitor_data=competitor_data,
             meta_data=meta_data,
             images=images,
-            iterations=iteration - 1
+            iterations=iterations
         )
         
-        report_path = self._save_report(keyword, report)
-        self.logger.info(f"✓ Report gespeichert: {report_path}")
+        report_path = self._save_report(run_slug, run_timestamp, report)
+        self.logger.info("✓ Report gespeichert: %s", report_path)
+        
+        if self.run_cache is not None:
+            self.run_cache.put(run_key, {'text': optimized_text}, scope=run_scope)
         
         # Ergebnis zusammenstellen
         result = {
@@ -177,8 +218,8 @@ class SEOContentGenerator:
             "content_type": content_type,
             "final_score": current_score,
             "target_score": target_score,
-            "iterations": iteration - 1,
-            "word_count": len(optimized_text.split()),
+            "iterations": iterations,
+            "word_count": report['content_metrics']['word_count'],  # bereits im Report gezählt
             "meta_data": meta_data,
             "images_generated": len(images),
             "output_path": str(output_path),
@@ -186,49 +227,145 @@ class SEOContentGenerator:
             "score_breakdown": score_result
         }
         
-        self.logger.info(f"✅ Content-Generierung abgeschlossen! Final Score: {current_score}/100")
+        self.logger.info("✅ Content-Generierung abgeschlossen! Final Score: %s/100", current_score)
         
         return result
     
-    def _save_output(self, keyword: str, html: str, text: str, meta_data: dict) -> Path:
-        """Speichere generierten Content"""
-        from datetime import datetime
-        from slugify import slugify
+    def _draft_and_optimize(
+        self,
+        keyword: str,
+        content_type: str,
+        target_score: int,
+        word_count: Optional[int],
+        competitor_data: dict
+    ) -> Tuple[str, dict, float, int]:
+        """
+        Erstelle Text-Entwurf und optimiere ihn iterativ (Phase 2-4)
+        
+        Args:
+            keyword: Ziel-Keyword
+            content_type: Art des Contents
+            target_score: Ziel Content Score
+            word_count: Gewünschte Wortanzahl (optional)
+            competitor_data: Ergebnis der Konkurrenzanalyse
+            
+        Returns:
+            Tupel (Text, Scoring-Ergebnis, Score, Anzahl Iterationen)
+        """
+        # Phase 2: Ersten Text-Entwurf generieren
+        self.logger.info("Phase 2: Generiere ersten Text-Entwurf...")
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        slug = slugify(keyword)
+        generation_params = {
+            "keyword": keyword,
+            "content_type": content_type,
+            "competitor_data": competitor_data,
+            "word_count": word_count or self.config.get("content.word_count_min", 1000)
+        }
         
-        output_dir = Path("data/outputs") / f"{slug}_{timestamp}"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        draft_text = self.text_generator.generate(generation_params)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("✓ Entwurf erstellt (%d Wörter)", len(draft_text.split()))
         
-        # HTML speichern
-        html_path = output_dir / "content.html"
-        html_path.write_text(html, encoding="utf-8")
+        # Phase 3: Content Score berechnen
+        self.logger.info("Phase 3: Berechne Content Score...")
+        score_result = self._score(draft_text, keyword, competitor_data)
+        current_score = score_result['total_score']
+        self.logger.info("✓ Aktueller Score: %s/100", current_score)
         
-        # Markdown speichern
-        md_path = output_dir / "content.md"
-        md_path.write_text(text, encoding="utf-8")
+        # Phase 4: Iterative Optimierung
+        iteration = 1
+        max_iterations = self.config.get("scoring.max_iterations", 5)
+        min_improvement = self.config.get("scoring.min_improvement", 2)
+        optimized_text = draft_text
         
-        # Meta-Daten speichern
-        meta_path = output_dir / "meta.json"
-        meta_path.write_text(json.dumps(meta_data, ensure_ascii=False, indent=2), encoding="utf-8")
+        while current_score < target_score and iteration <= max_iterations:
+            self.logger.info(
+                "Phase 4.%d: Optimiere Text (Score: %s → Ziel: %s)...",
+                iteration, current_score, target_score
+            )
+            
+            # Optimierungsvorschläge generieren
+            suggestions = self.content_scorer.get_improvement_suggestions(score_result)
+            
+            # Text optimieren
+            optimized_text = self.text_generator.optimize(
+                optimized_text,
+                suggestions,
+                generation_params
+            )
+            
+            # Neuen Score berechnen
+            score_result = self._score(optimized_text, keyword, competitor_data)
+            new_score = score_result['total_score']
+            
+            self.logger.info("✓ Score verbessert: %s → %s", current_score, new_score)
+            
+            if new_score <= current_score:
+                self.logger.warning("Keine Verbesserung, breche Optimierung ab")
+                break
+            
+            improvement = new_score - current_score
+            current_score = new_score
+            iteration += 1
+            
+            if improvement < min_improvement:
+                self.logger.info(
+                    "Geringe Verbesserung (+%.2f < %s), beende Optimierung",
+                    improvement, min_improvement
+                )
+                break
         
-        return html_path
+        return optimized_text, score_result, current_score, iteration - 1
     
-    def _save_report(self, keyword: str, report: dict) -> Path:
-        """Speichere Report"""
-        from datetime import datetime
-        from slugify import slugify
+    def _score(self, text: str, keyword: str, competitor_data: dict) -> dict:
+        """
+        Berechne Content Score mit Cache für identische Texte
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        slug = slugify(keyword)
+        Keyword und Konkurrenz-Daten sind innerhalb eines Laufs konstant,
+        daher genügt der Text-Hash als Schlüssel.
+        """
+        text_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
         
-        # History speichern
-        history_dir = Path("data/history")
-        history_dir.mkdir(parents=True, exist_ok=True)
+        if text_hash not in self._score_cache:
+            self._score_cache[text_hash] = self.content_scorer.score(text, keyword, competitor_data)
+        else:
+            self.logger.debug("Score aus Cache übernommen")
         
-        history_path = history_dir / f"{slug}_{timestamp}.json"
-        history_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        return self._score_cache[text_hash]
+    
+    def _save_output(self, slug: str, timestamp: str, html: str, text: str, meta_data: dict) -> Path:
+        """Speichere generierten Content"""
+        output_dir = OUTPUT_DIR / f"{slug}_{timestamp}"
+        if output_dir not in self._created_dirs:
+            output_dir.mkdir(exist_ok=True)
+            self._created_dirs.add(output_dir)
+        
+        html_path = output_dir / "content.html"
+        md_path = output_dir / "content.md"
+        meta_path = output_dir / "meta.json"
+        
+        # Serialisiere Meta-Daten vor dem parallelen Schreiben
+        meta_json = dumps_bytes(meta_data)
+        
+        # HTML, Markdown und Meta-Daten unabhängig voneinander speichern
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(html_path.write_text, html, encoding="utf-8"),
+                executor.submit(md_path.write_text, text, encoding="utf-8"),
+                executor.submit(meta_path.write_bytes, meta_json)
+            ]
+        
+        # Fehler beim Schreiben weiterreichen
+        for future in futures:
+            future.result()
+        
+        return html_path
+    
+    def _save_report(self, slug: str, timestamp: str, report: dict) -> Path:
+        """Speichere Report"""
+        # History speichern (Verzeichnis wird in __init__ angelegt)
+        history_path = HISTORY_DIR / f"{slug}_{timestamp}.json"
+        history_path.write_bytes(dumps_bytes(report))
         
         return history_path
 
@@ -360,6 +497,12 @@ def main():
         help="Pfad zur Konfigurationsdatei (default: config.json)"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Caches deaktivieren (Suchergebnisse, Seiten und frühere Läufe neu abrufen)"
+    )
+    
     args = parser.parse_args()
     
     # Interaktiver Modus
@@ -375,7 +518,7 @@ def main():
     
     # Generator starten
     try:
-        generator = SEOContentGenerator(args.config)
+        generator = SEOContentGenerator(args.config, use_cache=not args.no_cache)
         result = generator.generate_content(
             keyword=args.keyword,
             content_type=args.type,
@@ -2,11 +2,201 @@
 Competitor Analyzer - Analysiert Top 5 Google-Rankings
 """
 
-from typing import Dict, List
-import statistics
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+import heapq
+import re
+from collections import Counter
+import numpy as np
 from src.analyzer.google_scraper import GoogleScraper
 from src.analyzer.content_extractor import ContentExtractor
 from src.utils.logger import get_logger
+from src.utils.semantic_cache import SemanticCache
+
+
+_WORD_RE = re.compile(r'\S+')
+
+# Volltexte werden nur für die Benchmarks gebraucht und nicht im Cache abgelegt
+_UNCACHED_COMPETITOR_FIELDS = frozenset({'text_content'})
+
+
+def _count_words(text: str) -> int:
+    """Zähle Wörter ohne eine Liste der Teilstrings anzulegen"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+def _keyword_stats(text: str, keyword: str) -> Tuple[int, int]:
+    """
+    Zähle Keyword-Vorkommen und Wörter eines Textes
+    
+    Args:
+        text: Text in Kleinbuchstaben
+        keyword: Keyword in Kleinbuchstaben
+        
+    Returns:
+        Tupel (Keyword-Vorkommen, Wortanzahl)
+    """
+    return text.count(keyword), _count_words(text)
+
+
+def _summarize(values: List[float]) -> Dict[str, float]:
+    """
+    Berechne Min, Max, Mittelwert und Median einer Messreihe
+    
+    Min, Max und Median (bei ungerader Anzahl) behalten den Typ der
+    Messwerte, d.h. ganzzahlige Wortanzahlen bleiben int.
+    
+    Args:
+        values: Messwerte
+        
+    Returns:
+        Statistiken (0 bei leerer Messreihe)
+    """
+    if not values:
+        return {'min': 0, 'max': 0, 'avg': 0, 'median': 0}
+    
+    arr = np.asarray(values)
+    median = np.median(arr)
+    if len(arr) % 2:
+        # Bei ungerader Anzahl ist der Median ein Messwert
+        median = arr.dtype.type(median)
+    
+    return {
+        'min': arr.min().item(),
+        'max': arr.max().item(),
+        'avg': float(arr.mean()),
+        'median': median.item()
+    }
+
+
+def _top_topics(topic_counts: Counter, top_n: int = 15) -> List[str]:
+    """
+    Wähle die häufigsten Themen aus
+    
+    Args:
+        topic_counts: Vorkommen je Thema
+        top_n: Anzahl Themen
+        
+    Returns:
+        Themen nach Häufigkeit (bei Gleichstand alphabetisch)
+    """
+    top_keywords = heapq.nsmallest(
+        top_n,
+        topic_counts.items(),
+        key=lambda item: (-item[1], item[0])
+    )
+    return [kw for kw, _ in top_keywords]
+
+
+class BenchmarkAccumulator:
+    """Sammelt Benchmark-Metriken inkrementell, sobald Konkurrenz-Daten eintreffen"""
+    
+    def __init__(self, keyword: str):
+        """
+        Initialisiere Accumulator
+        
+        Args:
+            keyword: Analysiertes Keyword
+        """
+        self.kw_lower = keyword.lower()
+        self.competitor_count = 0
+        self.word_counts = []
+        self.structure_scores = []
+        self.keyword_densities = []
+        self.h1_total = self.h2_total = self.h3_total = 0
+        self.image_total = self.images_with_alt_total = 0
+        self.topic_counts = Counter()
+    
+    def update(self, competitor: Dict) -> None:
+        """
+        Übernehme Metriken eines Konkurrenten
+        
+        Args:
+            competitor: Konkurrenten-Daten
+        """
+        self.competitor_count += 1
+        
+        word_count = competitor.get('word_count', 0)
+        if word_count > 0:
+            self.word_counts.append(word_count)
+        if 'structure_score' in competitor:
+            self.structure_scores.append(competitor['structure_score'])
+        
+        headings = competitor.get('headings', {})
+        self.h1_total += len(competitor.get('h1', []))
+        self.h2_total += len(headings.get('h2', []))
+        self.h3_total += len(headings.get('h3', []))
+        
+        images = competitor.get('images', [])
+        self.image_total += len(images)
+        self.images_with_alt_total += sum(1 for img in images if img.get('alt'))
+        
+        # Keyword-Dichte
+        text_lower = competitor.get('text_content', '').lower()
+        if text_lower and self.kw_lower:
+            count, words = _keyword_stats(text_lower, self.kw_lower)
+            density = (count / words * 100) if words > 0 else 0
+            self.keyword_densities.append(density)
+        
+        # Themen
+        self.topic_counts.update({
+            kw_data['keyword']: kw_data['count']
+            for kw_data in competitor.get('keywords', [])
+        })
+    
+    def finalize(self) -> Dict:
+        """
+        Berechne Benchmark-Statistiken
+        
+        Returns:
+            Benchmark-Metriken (leer, falls keine Konkurrenten)
+        """
+        if not self.competitor_count:
+            return {}
+        
+        n = self.competitor_count
+        word_stats = _summarize(self.word_counts)
+        structure_stats = _summarize(self.structure_scores)
+        density_stats = _summarize(self.keyword_densities)
+        
+        return {
+            'word_count': {
+                'min': word_stats['min'],
+                'max': word_stats['max'],
+                'avg': word_stats['avg'],
+                'median': word_stats['median']
+            },
+            'structure_score': {
+                'avg': structure_stats['avg'],
+                'max': structure_stats['max']
+            },
+            'headings': {
+                'h1_avg': self.h1_total / n,
+                'h2_avg': self.h2_total / n,
+                'h3_avg': self.h3_total / n
+            },
+            'images': {
+                'count_avg': self.image_total / n,
+                'with_alt_avg': self.images_with_alt_total / n
+            },
+            'keyword_density': {
+                'avg': density_stats['avg'],
+                'min': density_stats['min'],
+                'max': density_stats['max']
+            }
+        }
+    
+    def common_topics(self, top_n: int = 15) -> List[str]:
+        """
+        Häufigste Themen über alle Konkurrenten
+        
+        Args:
+            top_n: Anzahl Themen
+            
+        Returns:
+            Themen nach Häufigkeit (bei Gleichstand alphabetisch)
+        """
+        return _top_topics(self.topic_counts, top_n)
 
 
 class CompetitorAnalyzer:
@@ -23,6 +213,18 @@ class CompetitorAnalyzer:
         self.logger = get_logger()
         self.google_scraper = GoogleScraper(config)
         self.content_extractor = ContentExtractor(config)
+        
+        # Semantic Cache für ähnliche Keywords
+        self.cache = None
+        if config.get("cache.enabled", True):
+            cache_dir = Path(config.get("cache.directory", "data/cache"))
+            self.cache = SemanticCache(
+                str(cache_dir / "competitor_analysis"),
+                threshold=config.get("cache.analysis_similarity", 0.87),
+                max_entries=config.get("cache.max_entries", 500),
+                model_name=config.get("cache.embedding_model", "all-MiniLM-L6-v2"),
+                flush_interval=config.get("cache.flush_interval_ms", 5000) / 1000
+            )
     
     def analyze(self, keyword: str) -> Dict:
         """
@@ -34,7 +236,13 @@ class CompetitorAnalyzer:
         Returns:
             Analyse-Ergebnisse mit Benchmarks und Insights
         """
-        self.logger.info(f"Starte Konkurrenzanalyse für: '{keyword}'")
+        self.logger.info("Starte Konkurrenzanalyse für: '%s'", keyword)
+        
+        if self.cache is not None:
+            cached = self.cache.get(keyword)
+            if cached is not None:
+                self.logger.info("✓ Konkurrenzanalyse aus Cache geladen")
+                return cached
         
         # 1. Hole Top 5 Google-Ergebnisse
         search_results = self.google_scraper.get_top_competitors(keyword, count=5)
@@ -43,10 +251,15 @@ class CompetitorAnalyzer:
             self.logger.warning("Keine Suchergebnisse gefunden")
             return self._empty_analysis(keyword)
         
-        # 2. Extrahiere Content von jeder URL
-        competitors = []
-        for result in search_results:
-            content_data = self.content_extractor.extract(result['url'])
+        # 2. Extrahiere Content von jeder URL (parallel, da I/O-gebunden)
+        #    und übernehme die Metriken, sobald eine Seite fertig ist
+        accumulator = BenchmarkAccumulator(keyword)
+        competitors = [None] * len(search_results)
+        
+        urls = [result['url'] for result in search_results]
+        
+        for index, content_data in self.content_extractor.iter_extract(urls):
+            result = search_results[index]
             
             # Kombiniere Search-Result mit Content-Daten
             competitor = {
@@ -54,13 +267,19 @@ class CompetitorAnalyzer:
                 **content_data
             }
             
-            competitors.append(competitor)
+            competitors[index] = competitor
+            accumulator.update(competitor)
         
         # 3. Berechne Benchmarks
-        benchmarks = self._calculate_benchmarks(competitors, keyword)
+        benchmarks = accumulator.finalize()
         
         # 4. Identifiziere Content-Gaps und Opportunities
-        insights = self._generate_insights(competitors, keyword, benchmarks)
+        insights = self._generate_insights(
+            competitors,
+            keyword,
+            benchmarks,
+            common_topics=accumulator.common_topics()
+        )
         
         analysis_result = {
             'keyword': keyword,
@@ -70,80 +289,26 @@ class CompetitorAnalyzer:
             'competitor_count': len(competitors)
         }
         
-        self.logger.info(f"✓ Konkurrenzanalyse abgeschlossen: {len(competitors)} Seiten analysiert")
-        
-        return analysis_result
-    
-    def _calculate_benchmarks(self, competitors: List[Dict], keyword: str) -> Dict:
-        """
-        Berechne Benchmark-Werte aus Konkurrenz-Daten
-        
-        Args:
-            competitors: Liste der Konkurrenten
-            keyword: Analysiertes Keyword
-            
-        Returns:
-            Benchmark-Metriken
-        """
-        if not competitors:
-            return {}
-        
-        # Sammle Metriken
-        word_counts = [c['word_count'] for c in competitors if c.get('word_count', 0) > 0]
-        structure_scores = [c['structure_score'] for c in competitors if 'structure_score' in c]
+        self.logger.info("✓ Konkurrenzanalyse abgeschlossen: %d Seiten analysiert", len(competitors))
         
-        h1_counts = [len(c.get('h1', [])) for c in competitors]
-        h2_counts = [len(c.get('headings', {}).get('h2', [])) for c in competitors]
-        h3_counts = [len(c.get('headings', {}).get('h3', [])) for c in competitors]
-        
-        image_counts = [len(c.get('images', [])) for c in competitors]
-        images_with_alt = [
-            sum(1 for img in c.get('images', []) if img.get('alt'))
-            for c in competitors
-        ]
-        
-        # Keyword-Dichten
-        keyword_densities = []
-        for c in competitors:
-            text = c.get('text_content', '').lower()
-            kw_lower = keyword.lower()
-            if text and kw_lower:
-                count = text.count(kw_lower)
-                words = len(text.split())
-                density = (count / words * 100) if words > 0 else 0
-                keyword_densities.append(density)
-        
-        # Berechne Statistiken
-        benchmarks = {
-            'word_count': {
-                'min': min(word_counts) if word_counts else 0,
-                'max': max(word_counts) if word_counts else 0,
-                'avg': statistics.mean(word_counts) if word_counts else 0,
-                'median': statistics.median(word_counts) if word_counts else 0
-            },
-            'structure_score': {
-                'avg': statistics.mean(structure_scores) if structure_scores else 0,
-                'max': max(structure_scores) if structure_scores else 0
-            },
-            'headings': {
-                'h1_avg': statistics.mean(h1_counts) if h1_counts else 0,
-                'h2_avg': statistics.mean(h2_counts) if h2_counts else 0,
-                'h3_avg': statistics.mean(h3_counts) if h3_counts else 0
-            },
-            'images': {
-                'count_avg': statistics.mean(image_counts) if image_counts else 0,
-                'with_alt_avg': statistics.mean(images_with_alt) if images_with_alt else 0
-            },
-            'keyword_density': {
-                'avg': statistics.mean(keyword_densities) if keyword_densities else 0,
-                'min': min(keyword_densities) if keyword_densities else 0,
-                'max': max(keyword_densities) if keyword_densities else 0
-            }
-        }
+        if self.cache is not None:
+            self.cache.put(keyword, {
+                **analysis_result,
+                'competitors': [
+                    {key: value for key, value in competitor.items() if key not in _UNCACHED_COMPETITOR_FIELDS}
+                    for competitor in competitors
+                ]
+            })
         
-        return benchmarks
+        return analysis_result
     
-    def _generate_insights(self, competitors: List[Dict], keyword: str, benchmarks: Dict) -> Dict:
+    def _generate_insights(
+        self,
+        competitors: List[Dict],
+        keyword: str,
+        benchmarks: Dict,
+        common_topics: Optional[List[str]] = None
+    ) -> Dict:
         """
         Generiere Insights und Empfehlungen
         
@@ -151,17 +316,21 @@ class CompetitorAnalyzer:
             competitors: Konkurrenten-Daten
             keyword: Keyword
             benchmarks: Berechnete Benchmarks
+            common_topics: Bereits ermittelte Themen (optional)
             
         Returns:
             Insights und Empfehlungen
         """
+        if common_topics is None:
+            common_topics = self._extract_common_topics(competitors)
+        
         insights = {
             'recommended_word_count': int(benchmarks['word_count']['avg'] * 1.1),  # 10% mehr
             'recommended_h2_count': max(3, int(benchmarks['headings']['h2_avg'])),
             'recommended_h3_count': max(2, int(benchmarks['headings']['h3_avg'])),
             'recommended_image_count': max(2, int(benchmarks['images']['count_avg'])),
             'target_keyword_density': benchmarks['keyword_density']['avg'],
-            'common_topics': self._extract_common_topics(competitors),
+            'common_topics': common_topics,
             'content_gaps': self._identify_content_gaps(competitors, keyword),
             'best_practices': self._identify_best_practices(competitors)
         }
@@ -178,28 +347,14 @@ class CompetitorAnalyzer:
         Returns:
             Liste häufiger Themen/Keywords
         """
-        # Sammle alle Keywords von allen Konkurrenten
-        all_keywords = {}
-        
+        topic_counts = Counter()
         for competitor in competitors:
-            for kw_data in competitor.get('keywords', []):
-                keyword = kw_data['keyword']
-                count = kw_data['count']
-                
-                if keyword in all_keywords:
-                    all_keywords[keyword] += count
-                else:
-                    all_keywords[keyword] = count
-        
-        # Sortiere nach Häufigkeit
-        sorted_keywords = sorted(
-            all_keywords.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+            topic_counts.update({
+                kw_data['keyword']: kw_data['count']
+                for kw_data in competitor.get('keywords', [])
+            })
         
-        # Top 15 Themen
-        return [kw for kw, _ in sorted_keywords[:15]]
+        return _top_topics(topic_counts)
     
     def _identify_content_gaps(self, competitors: List[Dict], keyword: str) -> List[str]:
         """
@@ -214,21 +369,29 @@ class CompetitorAnalyzer:
         """
         gaps = []
         
+        # Zähle fehlende Elemente und kurze Texte in einem Durchlauf
+        missing_h1 = missing_meta_desc = low_image_count = short_content = 0
+        for c in competitors:
+            if not c.get('h1'):
+                missing_h1 += 1
+            if not c.get('meta_description'):
+                missing_meta_desc += 1
+            if len(c.get('images', [])) < 2:
+                low_image_count += 1
+            if c.get('word_count', 0) < 500:
+                short_content += 1
+        
         # Prüfe auf fehlende Elemente bei Konkurrenten
-        missing_h1 = sum(1 for c in competitors if not c.get('h1'))
         if missing_h1 > 2:
             gaps.append("Viele Konkurrenten haben keine klare H1-Struktur")
         
-        missing_meta_desc = sum(1 for c in competitors if not c.get('meta_description'))
         if missing_meta_desc > 2:
             gaps.append("Mehrere Konkurrenten haben keine Meta-Description")
         
-        low_image_count = sum(1 for c in competitors if len(c.get('images', [])) < 2)
         if low_image_count > 3:
             gaps.append("Wenige Bilder bei Konkurrenten - Opportunity für visuellen Content")
         
         # Prüfe auf kurze Texte
-        short_content = sum(1 for c in competitors if c.get('word_count', 0) < 500)
         if short_content > 2:
             gaps.append("Viele Konkurrenten haben kurze Texte - Chance für ausführlichen Content")
         
@@ -244,7 +407,8 @@ class CompetitorAnalyzer:
         Returns:
             Liste von Best Practices
         """
-        practices = []
+        # Dict als geordnetes Set: dedupliziert unter Beibehaltung der Reihenfolge
+        practices = {}
         
         # Analysiere Top 3 Performer
         top_performers = sorted(
@@ -256,22 +420,21 @@ class CompetitorAnalyzer:
         for performer in top_performers:
             # Lange, ausführliche Texte
             if performer.get('word_count', 0) > 1000:
-                practices.append(f"Ausführlicher Content ({performer['word_count']} Wörter)")
+                practices[f"Ausführlicher Content ({performer['word_count']} Wörter)"] = None
             
             # Gute Überschriften-Struktur
             h2_count = len(performer.get('headings', {}).get('h2', []))
             if h2_count >= 5:
-                practices.append(f"Klare Struktur mit {h2_count} H2-Überschriften")
+                practices[f"Klare Struktur mit {h2_count} H2-Überschriften"] = None
             
             # Viele Bilder mit Alt-Tags
             images = performer.get('images', [])
             if len(images) >= 3:
                 alt_count = sum(1 for img in images if img.get('alt'))
                 if alt_count >= len(images) * 0.8:
-                    practices.append(f"{len(images)} Bilder mit SEO-optimierten Alt-Tags")
+                    practices[f"{len(images)} Bilder mit SEO-optimierten Alt-Tags"] = None
         
-        # Dedupliziere
-        return list(set(practices))
+        return list(practices)
     
     def _empty_analysis(self, keyword: str) -> Dict:
         """Erstelle leere Analyse bei Fehler"""
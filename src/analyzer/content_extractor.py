@@ -4,13 +4,113 @@ Extrahiert Text, Struktur und SEO-Elemente von Konkurrenz-Seiten
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 from bs4 import BeautifulSoup
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import re
-from collections import Counter
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from operator import methodcaller
+import numpy as np
+from pathlib import Path
+from src.utils.http_cache import HTTPCache
 from src.utils.logger import get_logger
 
 
+_WS_RE = re.compile(r'\s+')
+
+# Wörter mit mindestens 4 Zeichen (Satzzeichen trennen wie Leerzeichen)
+_TOKEN_RE = re.compile(r'\w{4,}')
+
+# Vereinfachte deutsche Stopwörter
+_STOPWORDS = frozenset({
+    'der', 'die', 'das', 'den', 'dem', 'des', 'ein', 'eine', 'einer', 'eines',
+    'und', 'oder', 'aber', 'ist', 'sind', 'war', 'waren', 'wird', 'werden',
+    'hat', 'haben', 'kann', 'können', 'muss', 'müssen', 'soll', 'sollen',
+    'für', 'mit', 'auf', 'bei', 'von', 'zu', 'im', 'am', 'an', 'als', 'auch',
+    'nicht', 'nur', 'noch', 'mehr', 'sehr', 'wie', 'was', 'wenn', 'dass',
+    'sich', 'sie', 'er', 'es', 'wir', 'ihr', 'ich', 'du', 'man', 'diese',
+    'dieser', 'dieses', 'alle', 'jede', 'jeder', 'jedes', 'nach', 'über',
+    'aus', 'durch', 'um', 'bis', 'zum', 'zur'
+})
+
+_HEADING_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+
+# Bereiche, die nicht zum Haupt-Content zählen
+_REMOVED_TAGS = ('script', 'style', 'nav', 'footer', 'header')
+
+# Alle Tags, die bei der Extraktion benötigt werden
+_COLLECT_TAGS = ['title', 'meta', 'img', 'a', *_HEADING_TAGS, *_REMOVED_TAGS]
+
+# Kennzahlen einer Seite für die (vektorisierte) Struktur-Bewertung
+STRUCTURE_DTYPE = np.dtype([
+    ('title_len', 'i4'),
+    ('desc_len', 'i4'),
+    ('h1_count', 'i4'),
+    ('h2_count', 'i4'),
+    ('h3_count', 'i4'),
+    ('word_count', 'i4'),
+    ('img_total', 'i4'),
+    ('img_with_alt', 'i4'),
+    ('link_total', 'i4')
+])
+
+# Ab dieser Anzahl unterschiedlicher Wörter lohnt sich die NumPy-Auswahl
+_ARGPARTITION_MIN_UNIQUE = 200
+
+
+def _most_common(word_counts: Counter, top_n: int) -> List[Tuple[str, int]]:
+    """
+    Top-N Wörter wie Counter.most_common, bei großen Zählern in NumPy
+    
+    Gleichstände werden wie bei most_common nach erstem Auftreten sortiert.
+    
+    Args:
+        word_counts: Wort-Häufigkeiten
+        top_n: Anzahl Top-Wörter
+        
+    Returns:
+        Liste mit (Wort, Anzahl), absteigend nach Anzahl
+    """
+    size = len(word_counts)
+    if size <= _ARGPARTITION_MIN_UNIQUE or top_n >= size:
+        return word_counts.most_common(top_n)
+    
+    if top_n <= 0:
+        return []
+    
+    counts = np.fromiter(word_counts.values(), dtype=np.int64, count=size)
+    
+    # Schwellwert = N-größte Anzahl (lineare Auswahl statt Heap über alle Wörter)
+    threshold = np.partition(counts, size - top_n)[size - top_n]
+    above = np.flatnonzero(counts > threshold)
+    ties = np.flatnonzero(counts == threshold)[:top_n - len(above)]
+    
+    # Absteigend nach Anzahl, bei Gleichstand nach erstem Auftreten
+    idx = np.concatenate((above, ties))
+    idx = idx[np.lexsort((idx, -counts[idx]))]
+    
+    words = list(word_counts)
+    return [(words[i], int(counts[i])) for i in idx]
+
+
+def parse_html(markup: str, content_type: str = "") -> BeautifulSoup:
+    """
+    Parse HTML mit dem C-basierten lxml-Parser
+    
+    Args:
+        markup: HTML- bzw. XHTML-Quelltext
+        content_type: Content-Type Header der Antwort
+        
+    Returns:
+        BeautifulSoup-Objekt
+    """
+    # XHTML als XML parsen, sonst den schnellen HTML-Parser von lxml
+    parser = 'lxml-xml' if 'xhtml+xml' in content_type.lower() else 'lxml'
+    return BeautifulSoup(markup, parser)
+
+
 class ContentExtractor:
     """Extrahiert und analysiert Content von Webseiten"""
     
@@ -24,6 +124,70 @@ class ContentExtractor:
         self.config = config
         self.logger = get_logger()
         self.timeout = 10
+        self.max_workers = config.get("extraction.max_workers", 8)
+        
+        # Persistente Session: Keep-Alive und wiederverwendete TLS-Verbindungen
+        pool_size = config.get("extraction.pool_size", 16)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers['User-Agent'] = self.config.get("google_search.user_agent")
+        
+        # Komprimierte Übertragung; Brotli nur anbieten, wenn urllib3 es dekodieren kann
+        self.session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        
+        # Persistenter Cache für extrahierte Seiten
+        self.cache = None
+        if config.get("cache.enabled", True):
+            self.cache = HTTPCache(
+                str(Path(config.get("cache.http_directory", "data/.cache/http")) / "pages"),
+                ttl_hours=config.get("cache.page_ttl_hours", 24)
+            )
+    
+    def extract_many(self, urls: List[str]) -> List[Dict]:
+        """
+        Extrahiere mehrere URLs parallel
+        
+        Args:
+            urls: Zu analysierende URLs
+            
+        Returns:
+            Liste mit extrahierten Daten in Eingabe-Reihenfolge
+        """
+        results = [None] * len(urls)
+        for index, data in self.iter_extract(urls):
+            results[index] = data
+        return results
+    
+    def iter_extract(self, urls: List[str]) -> Iterator[Tuple[int, Dict]]:
+        """
+        Extrahiere mehrere URLs parallel und liefere Ergebnisse sobald fertig
+        
+        Args:
+            urls: Zu analysierende URLs
+            
+        Yields:
+            Tupel (Index der URL, extrahierte Daten) in Abschluss-Reihenfolge
+        """
+        if not urls:
+            return
+        
+        workers = max(1, min(self.max_workers, len(urls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.extract, url): index
+                for index, url in enumerate(urls)
+            }
+            
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    data = future.result()
+                except Exception as e:
+                    self.logger.error(f"Fehler beim Extrahieren von {urls[index]}: {e}")
+                    data = self._empty_result(urls[index])
+                yield index, data
     
     def extract(self, url: str) -> Dict:
         """
@@ -37,28 +201,36 @@ class ContentExtractor:
         """
         self.logger.debug(f"Extrahiere Content von: {url}")
         
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                self.logger.debug(f"✓ Content aus Cache: {url}")
+                return cached
+        
         try:
             # Hole HTML
-            response = requests.get(
-                url,
-                timeout=self.timeout,
-                headers={'User-Agent': self.config.get("google_search.user_agent")}
-            )
+            response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = parse_html(response.text, response.headers.get('Content-Type', ''))
+            
+            # Sammle alle relevanten Elemente in einem einzigen DOM-Durchlauf
+            elements = self._collect_elements(soup)
+            headings = self._extract_headings(elements)
+            images = self._extract_images(elements)
+            links = self._extract_links(elements)
             
             # Extrahiere verschiedene Elemente
             data = {
                 'url': url,
-                'title': self._extract_title(soup),
-                'meta_description': self._extract_meta_description(soup),
-                'h1': self._extract_h1(soup),
-                'headings': self._extract_headings(soup),
-                'text_content': self._extract_text(soup),
+                'title': self._extract_title(elements),
+                'meta_description': self._extract_meta_description(elements),
+                'h1': list(headings['h1']),
+                'headings': headings,
+                'text_content': self._extract_text(soup, elements),
                 'word_count': 0,
-                'images': self._extract_images(soup),
-                'links': self._extract_links(soup),
+                'images': images,
+                'links': links,
                 'keywords': [],
                 'structure_score': 0
             }
@@ -74,6 +246,9 @@ class ContentExtractor:
             
             self.logger.debug(f"✓ Content extrahiert: {data['word_count']} Wörter")
             
+            if self.cache is not None:
+                self.cache.set(url, data)
+            
             return data
             
         except requests.RequestException as e:
@@ -83,55 +258,73 @@ class ContentExtractor:
             self.logger.error(f"Fehler beim Extrahieren von {url}: {e}")
             return self._empty_result(url)
     
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _collect_elements(self, soup: BeautifulSoup) -> Dict[str, List]:
+        """
+        Sammle alle benötigten Tags in einem einzigen Durchlauf
+        
+        Bilder und Links innerhalb von Script-, Style-, Navigations-, Header-
+        und Footer-Bereichen werden verworfen, da diese Bereiche nicht zum
+        Haupt-Content zählen.
+        
+        Args:
+            soup: BeautifulSoup-Objekt
+            
+        Returns:
+            Dictionary Tag-Name -> Liste der Elemente (Dokument-Reihenfolge)
+        """
+        elements = defaultdict(list)
+        for element in soup.find_all(_COLLECT_TAGS):
+            elements[element.name].append(element)
+        
+        removed = {id(el) for name in _REMOVED_TAGS for el in elements[name]}
+        if removed:
+            for name in ('img', 'a'):
+                elements[name] = [
+                    el for el in elements[name]
+                    if not any(id(parent) in removed for parent in el.parents)
+                ]
+        
+        return elements
+    
+    def _extract_title(self, elements: Dict[str, List]) -> str:
         """Extrahiere Title-Tag"""
-        title_tag = soup.find('title')
-        return title_tag.get_text().strip() if title_tag else ""
+        titles = elements['title']
+        return titles[0].get_text().strip() if titles else ""
     
-    def _extract_meta_description(self, soup: BeautifulSoup) -> str:
+    def _extract_meta_description(self, elements: Dict[str, List]) -> str:
         """Extrahiere Meta Description"""
-        meta_tag = soup.find('meta', attrs={'name': 'description'})
-        if meta_tag and meta_tag.get('content'):
-            return meta_tag['content'].strip()
+        for meta_tag in elements['meta']:
+            if meta_tag.get('name') == 'description':
+                content = meta_tag.get('content')
+                return content.strip() if content else ""
         return ""
     
-    def _extract_h1(self, soup: BeautifulSoup) -> List[str]:
-        """Extrahiere alle H1-Überschriften"""
-        h1_tags = soup.find_all('h1')
-        return [h1.get_text().strip() for h1 in h1_tags]
-    
-    def _extract_headings(self, soup: BeautifulSoup) -> Dict[str, List[str]]:
+    def _extract_headings(self, elements: Dict[str, List]) -> Dict[str, List[str]]:
         """Extrahiere alle Überschriften (H1-H6)"""
-        headings = {}
-        
-        for level in range(1, 7):
-            tag_name = f'h{level}'
-            tags = soup.find_all(tag_name)
-            headings[tag_name] = [tag.get_text().strip() for tag in tags]
-        
-        return headings
+        return {
+            tag_name: [tag.get_text().strip() for tag in elements[tag_name]]
+            for tag_name in _HEADING_TAGS
+        }
     
-    def _extract_text(self, soup: BeautifulSoup) -> str:
+    def _extract_text(self, soup: BeautifulSoup, elements: Dict[str, List]) -> str:
         """Extrahiere Haupttext-Content"""
-        # Entferne Script und Style Tags
-        for script in soup(['script', 'style', 'nav', 'footer', 'header']):
-            script.decompose()
-        
-        # Hole Text
-        text = soup.get_text()
+        # Entferne Script und Style Tags (nur aushängen: der Baum wird
+        # danach verworfen, ein rekursives decompose() ist unnötig)
+        for tag_name in _REMOVED_TAGS:
+            for script in elements[tag_name]:
+                script.extract()
         
-        # Bereinige
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+        # Hole Text (Textknoten bereits getrimmt und mit Leerzeichen verbunden)
+        text = soup.get_text(separator=' ', strip=True)
         
-        return text
+        # Bereinige verbleibende Whitespace-Folgen
+        return _WS_RE.sub(' ', text)
     
-    def _extract_images(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _extract_images(self, elements: Dict[str, List]) -> List[Dict[str, str]]:
         """Extrahiere Bild-Informationen"""
         images = []
         
-        for img in soup.find_all('img'):
+        for img in elements['img']:
             img_data = {
                 'src': img.get('src', ''),
                 'alt': img.get('alt', ''),
@@ -141,24 +334,17 @@ class ContentExtractor:
         
         return images
     
-    def _extract_links(self, soup: BeautifulSoup) -> Dict[str, int]:
+    def _extract_links(self, elements: Dict[str, List]) -> Dict[str, int]:
         """Zähle interne und externe Links"""
-        links = soup.find_all('a', href=True)
+        hrefs = [a['href'] for a in elements['a'] if a.has_attr('href')]
         
-        internal = 0
-        external = 0
-        
-        for link in links:
-            href = link['href']
-            if href.startswith('http'):
-                external += 1
-            else:
-                internal += 1
+        total = len(hrefs)
+        external = sum(map(methodcaller('startswith', 'http'), hrefs))
         
         return {
-            'internal': internal,
+            'internal': total - external,
             'external': external,
-            'total': len(links)
+            'total': total
         }
     
     def _extract_keywords(self, text: str, top_n: int = 20) -> List[Dict[str, any]]:
@@ -172,38 +358,23 @@ class ContentExtractor:
         Returns:
             Liste mit Keywords und Häufigkeit
         """
-        # Bereinige Text
-        text = text.lower()
-        text = re.sub(r'[^\w\s]', ' ', text)
-        
-        # Entferne Stopwörter (vereinfachte deutsche Stopwörter)
-        stopwords = {
-            'der', 'die', 'das', 'den', 'dem', 'des', 'ein', 'eine', 'einer', 'eines',
-            'und', 'oder', 'aber', 'ist', 'sind', 'war', 'waren', 'wird', 'werden',
-            'hat', 'haben', 'kann', 'können', 'muss', 'müssen', 'soll', 'sollen',
-            'für', 'mit', 'auf', 'bei', 'von', 'zu', 'im', 'am', 'an', 'als', 'auch',
-            'nicht', 'nur', 'noch', 'mehr', 'sehr', 'wie', 'was', 'wenn', 'dass',
-            'sich', 'sie', 'er', 'es', 'wir', 'ihr', 'ich', 'du', 'man', 'diese',
-            'dieser', 'dieses', 'alle', 'jede', 'jeder', 'jedes', 'nach', 'über',
-            'aus', 'durch', 'um', 'bis', 'zum', 'zur'
-        }
-        
-        # Tokenize
-        words = text.split()
+        # Tokenize (Regex filtert kurze Wörter direkt in C)
+        words = _TOKEN_RE.findall(text.lower())
         
-        # Filtere kurze Wörter und Stopwörter
-        words = [w for w in words if len(w) > 3 and w not in stopwords]
-        
-        # Zähle
+        # Zähle alle Tokens in C und entferne danach nur die wenigen
+        # vorkommenden Stopwörter (statt jedes Token einzeln zu prüfen)
         word_counts = Counter(words)
+        total = len(words)
+        for stopword in _STOPWORDS.intersection(word_counts):
+            total -= word_counts.pop(stopword)
         
         # Top Keywords
         top_keywords = []
-        for word, count in word_counts.most_common(top_n):
+        for word, count in _most_common(word_counts, top_n):
             top_keywords.append({
                 'keyword': word,
                 'count': count,
-                'density': count / len(words) if words else 0
+                'density': count / total
             })
         
         return top_keywords
@@ -212,6 +383,9 @@ class ContentExtractor:
         """
         Berechne Struktur-Score basierend auf SEO-Best-Practices
         
+        Einzelne Seiten werden skalar bewertet; für mehrere Seiten auf
+        einmal siehe calculate_structure_scores.
+        
         Args:
             data: Extrahierte Daten
             
@@ -266,7 +440,7 @@ class ContentExtractor:
         images = data['images']
         if images:
             images_with_alt = sum(1 for img in images if img['alt'])
-            alt_ratio = images_with_alt / len(images) if images else 0
+            alt_ratio = images_with_alt / len(images)
             score += int(10 * alt_ratio)
         
         # Links vorhanden (10 Punkte)
@@ -275,6 +449,103 @@ class ContentExtractor:
         
         return min(score, max_score)
     
+    def calculate_structure_scores(self, pages: List[Dict]) -> List[int]:
+        """
+        Berechne Struktur-Scores für mehrere Seiten in einem NumPy-Durchlauf
+        
+        Args:
+            pages: Extrahierte Daten mehrerer Seiten
+            
+        Returns:
+            Scores von 0-100 in Eingabe-Reihenfolge
+        """
+        if len(pages) < 2:
+            return [self._calculate_structure_score(data) for data in pages]
+        
+        records = np.array([self._structure_record(data) for data in pages], dtype=STRUCTURE_DTYPE)
+        return self._calculate_structure_score_batch(records).tolist()
+    
+    @staticmethod
+    def _structure_record(data: Dict) -> tuple:
+        """
+        Reduziere extrahierte Daten auf die Kennzahlen für den Struktur-Score
+        
+        Args:
+            data: Extrahierte Daten
+            
+        Returns:
+            Tupel passend zu STRUCTURE_DTYPE
+        """
+        headings = data['headings']
+        images = data['images']
+        return (
+            len(data['title']),
+            len(data['meta_description']),
+            len(data['h1']),
+            len(headings.get('h2', [])),
+            len(headings.get('h3', [])),
+            data['word_count'],
+            len(images),
+            sum(1 for img in images if img['alt']),
+            data['links']['total']
+        )
+    
+    @staticmethod
+    def _calculate_structure_score_batch(records: np.ndarray) -> np.ndarray:
+        """
+        Berechne Struktur-Scores für viele Seiten auf einmal
+        
+        Args:
+            records: Structured Array mit STRUCTURE_DTYPE
+            
+        Returns:
+            Array mit Scores von 0-100
+        """
+        max_score = 100
+        score = np.zeros(len(records), dtype=np.int64)
+        
+        # Title vorhanden (10 Punkte), optimale Länge 50-60 Zeichen (5 Punkte)
+        title_len = records['title_len']
+        score += np.where(title_len > 0, 10, 0)
+        score += np.where((title_len >= 50) & (title_len <= 60), 5, 0)
+        
+        # Meta Description vorhanden (10 Punkte), optimale Länge 140-160 Zeichen (5 Punkte)
+        desc_len = records['desc_len']
+        score += np.where(desc_len > 0, 10, 0)
+        score += np.where((desc_len >= 140) & (desc_len <= 160), 5, 0)
+        
+        # H1 vorhanden und einzigartig (15 Punkte), mehrere H1 sind suboptimal
+        h1_count = records['h1_count']
+        score += np.where(h1_count == 1, 15, np.where(h1_count > 1, 5, 0))
+        
+        # Überschriften-Hierarchie (20 Punkte)
+        score += np.where(records['h2_count'] >= 3, 10, 0)
+        score += np.where(records['h3_count'] >= 2, 10, 0)
+        
+        # Content-Länge (15 Punkte)
+        word_count = records['word_count']
+        score += np.select(
+            [word_count >= 1000, word_count >= 500, word_count >= 300],
+            [15, 10, 5],
+            default=0
+        )
+        
+        # Bilder mit Alt-Tags (10 Punkte)
+        img_total = records['img_total']
+        has_images = img_total > 0
+        alt_ratio = np.divide(
+            records['img_with_alt'],
+            img_total,
+            out=np.zeros(len(records)),
+            where=has_images
+        )
+        score += np.floor(10 * alt_ratio).astype(np.int64)
+        
+        # Links vorhanden (10 Punkte)
+        score += np.where(records['link_total'] > 0, 10, 0)
+        
+        return np.minimum(score, max_score)
+    
     def _empty_result(self, url: str) -> Dict:
         """Erstelle leeres Ergebnis bei Fehler"""
         return {
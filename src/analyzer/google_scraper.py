@@ -3,13 +3,30 @@ Google Search Scraper für Top 5 Ranking-Analyse
 """
 
 import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from collections import deque
+from lxml import etree
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from pathlib import Path
 import time
 from urllib.parse import quote_plus
+from src.utils.http_cache import HTTPCache
 from src.utils.logger import get_logger
 
 
+def _has_class(*names: str) -> str:
+    """Erzeuge XPath-Bedingung für Elemente mit einer der CSS-Klassen"""
+    return ' or '.join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+        for name in names
+    )
+
+
+# Vorkompilierte XPath-Ausdrücke für Google-Ergebnisse
+_LINK_XPATH = etree.XPath("(.//a[@href])[1]")
+_TITLE_XPATH = etree.XPath("(.//h3)[1]")
+_SNIPPET_XPATH = etree.XPath(f"(.//div[{_has_class('VwiC3b', 'yXK7lf')}])[1]")
+
+
 class GoogleScraper:
     """Scraper für Google Search Results"""
     
@@ -28,6 +45,26 @@ class GoogleScraper:
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         )
         self.results_count = config.get("google_search.results_count", 5)
+        
+        # Persistente Session: Verbindung bleibt für Folgeabfragen offen
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': self.user_agent,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'de-DE,de;q=0.9,en;q=0.8',
+            'Accept-Encoding': 'gzip, deflate',
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1'
+        })
+        
+        # Persistenter Cache für SERPs (spart Anfragen bei wiederholten Läufen)
+        self.cache = None
+        if config.get("cache.enabled", True):
+            self.cache = HTTPCache(
+                str(Path(config.get("cache.http_directory", "data/.cache/http")) / "serp"),
+                ttl_hours=config.get("cache.serp_ttl_hours", 24)
+            )
     
     def search(self, keyword: str) -> List[Dict[str, str]]:
         """
@@ -41,6 +78,13 @@ class GoogleScraper:
         """
         self.logger.info(f"Suche Google.de nach: '{keyword}'")
         
+        cache_key = f"{keyword}|{self.results_count}"
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self.logger.info(f"✓ {len(cached)} Suchergebnisse aus Cache geladen")
+                return cached
+        
         try:
             # Search Query
             params = {
@@ -50,34 +94,31 @@ class GoogleScraper:
                 'num': self.results_count + 5  # Extra für Filterung
             }
             
-            headers = {
-                'User-Agent': self.user_agent,
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'de-DE,de;q=0.9,en;q=0.8',
-                'Accept-Encoding': 'gzip, deflate',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
-            
-            response = requests.get(
+            response = self.session.get(
                 self.base_url,
                 params=params,
-                headers=headers,
-                timeout=10
+                timeout=10,
+                stream=True
             )
             
-            response.raise_for_status()
-            
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            results = self._parse_results(soup)
+            with response:
+                response.raise_for_status()
+                
+                # Parse HTML inkrementell, Rest der Seite wird nicht mehr geparst
+                chunks = response.iter_content(chunk_size=8192)
+                results = self._parse_results(chunks, encoding=response.encoding)
+                
+                # Restliche Antwort lesen, damit die Keep-Alive-Verbindung in den Pool zurückgeht
+                deque(chunks, maxlen=0)
             
             # Filtere und limitiere
             filtered_results = self._filter_results(results)[:self.results_count]
             
             self.logger.info(f"✓ {len(filtered_results)} Suchergebnisse gefunden")
             
+            if self.cache is not None and filtered_results:
+                self.cache.set(cache_key, filtered_results)
+            
             return filtered_results
             
         except requests.RequestException as e:
@@ -87,56 +128,122 @@ class GoogleScraper:
             self.logger.error(f"Unerwarteter Fehler: {e}")
             return []
     
-    def _parse_results(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def _parse_results(self, chunks: Iterable[bytes], encoding: Optional[str] = None) -> List[Dict[str, str]]:
         """
-        Parse Suchergebnisse aus HTML
+        Parse Suchergebnisse inkrementell aus dem HTML-Stream
+        
+        Das Parsen endet, sobald genügend Ergebnisse den Filter passieren;
+        der Rest der Seite wird weder geparst noch als DOM aufgebaut.
         
         Args:
-            soup: BeautifulSoup-Objekt
+            chunks: HTML-Bytes in Teilstücken
+            encoding: Zeichenkodierung der Antwort (falls bekannt)
             
         Returns:
             Liste mit geparsten Ergebnissen
         """
         results = []
+        accepted = 0
         
-        # Finde organische Suchergebnisse
-        # Google verwendet verschiedene Selektoren, daher mehrere Varianten
-        search_divs = soup.find_all('div', class_='g')
+        # Ergebnis-Container in Dokument-Reihenfolge; verschachtelte
+        # Container enden vor ihrem Eltern-Element, daher erst übernehmen,
+        # wenn alle vorher begonnenen Container abgeschlossen sind
+        pending = deque()
+        finished = set()
         
-        for div in search_divs:
-            try:
-                # URL
-                link_tag = div.find('a', href=True)
-                if not link_tag:
-                    continue
-                
-                url = link_tag['href']
+        for event, element in self._iter_events(chunks, encoding):
+            # Finde organische Suchergebnisse
+            if element.tag != 'div' or 'g' not in (element.get('class') or '').split():
+                continue
+            
+            if event == 'start':
+                pending.append(element)
+                continue
+            
+            finished.add(element)
+            
+            while pending and pending[0] in finished:
+                div = pending.popleft()
+                finished.discard(div)
                 
-                # Überspringe Google-interne Links
-                if url.startswith('/search') or 'google.' in url:
+                result = self._parse_result(div)
+                if not result:
                     continue
                 
-                # Titel
-                title_tag = div.find('h3')
-                title = title_tag.get_text() if title_tag else "Kein Titel"
+                result['position'] = len(results) + 1
+                results.append(result)
                 
-                # Snippet/Description
-                snippet_div = div.find('div', class_=['VwiC3b', 'yXK7lf'])
-                snippet = snippet_div.get_text() if snippet_div else ""
-                
-                results.append({
-                    'url': url,
-                    'title': title,
-                    'snippet': snippet,
-                    'position': len(results) + 1
-                })
-                
-            except Exception as e:
-                self.logger.debug(f"Fehler beim Parsen eines Ergebnisses: {e}")
-                continue
+                if self._filter_results([result]):
+                    accepted += 1
+                    if accepted >= self.results_count:
+                        return results
+            
+            # Verarbeitete Teilbäume freigeben
+            if not pending:
+                element.clear()
         
         return results
     
+    def _iter_events(self, chunks: Iterable[bytes], encoding: Optional[str]) -> Iterator[Tuple[str, etree._Element]]:
+        """
+        Füttere den Pull-Parser und liefere Start-/End-Events
+        
+        Args:
+            chunks: HTML-Bytes in Teilstücken
+            encoding: Zeichenkodierung der Antwort (falls bekannt)
+            
+        Yields:
+            Tupel (Event, Element)
+        """
+        parser = etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+        
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from parser.read_events()
+        
+        parser.close()
+        yield from parser.read_events()
+    
+    def _parse_result(self, div: etree._Element) -> Optional[Dict[str, str]]:
+        """
+        Parse ein einzelnes Suchergebnis
+        
+        Args:
+            div: Ergebnis-Container
+            
+        Returns:
+            Ergebnis (URL, Titel, Snippet) oder None
+        """
+        try:
+            # URL
+            link_tags = _LINK_XPATH(div)
+            if not link_tags:
+                return None
+            
+            url = link_tags[0].get('href')
+            
+            # Überspringe Google-interne Links
+            if url.startswith('/search') or 'google.' in url:
+                return None
+            
+            # Titel
+            title_tags = _TITLE_XPATH(div)
+            title = ''.join(title_tags[0].itertext()) if title_tags else "Kein Titel"
+            
+            # Snippet/Description
+            snippet_divs = _SNIPPET_XPATH(div)
+            snippet = ''.join(snippet_divs[0].itertext()) if snippet_divs else ""
+            
+            return {
+                'url': url,
+                'title': title,
+                'snippet': snippet
+            }
+            
+        except Exception as e:
+            self.logger.debug(f"Fehler beim Parsen eines Ergebnisses: {e}")
+            return None
+    
     def _filter_results(self, results: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """
         Filtere unerwünschte Ergebnisse
@@ -2,19 +2,39 @@
 Image Generator - Generiert Bilder mit KI und erstellt SEO-Tags
 """
 
+import asyncio
 import os
+import shutil
 from typing import List, Dict
 from pathlib import Path
-from openai import OpenAI
+from openai import AsyncOpenAI
 import requests
 from datetime import datetime
-from slugify import slugify
 from src.utils.logger import get_logger
+from src.utils.openai_clients import create_async_client
+from src.utils.slug import cached_slugify
 
 
 class ImageGenerator:
     """Generiert Bilder mit KI und SEO-optimierten Tags"""
     
+    # Vorlagen für Alt- und Title-Tags (rotierend nach Bild-Nummer)
+    _ALT_TEMPLATES = (
+        "%s - Übersicht und Informationen",
+        "%s im Detail",
+        "Alles über %s",
+        "%s - Ratgeber und Tipps",
+        "%s erklärt"
+    )
+    
+    _TITLE_TEMPLATES = (
+        "%s | Professioneller Ratgeber",
+        "%s | Detaillierte Informationen",
+        "%s | Expertenwissen",
+        "%s | Umfassender Guide",
+        "%s | Alle Fakten"
+    )
+    
     def __init__(self, config):
         """
         Initialisiere Image Generator
@@ -25,9 +45,11 @@ class ImageGenerator:
         self.config = config
         self.logger = get_logger()
         
-        # OpenAI Client
-        api_key = os.getenv('OPENAI_API_KEY') or config.get("api_keys.openai")
-        self.client = OpenAI(api_key=api_key)
+        # OpenAI API-Key (Async-Client wird pro Lauf erzeugt)
+        self.api_key = os.getenv('OPENAI_API_KEY') or config.get("api_keys.openai")
+        
+        # Persistente Session für Bild-Downloads (Keep-Alive zum CDN)
+        self._http = requests.Session()
         
         # Image Settings
         self.model = config.get("api_keys.image_generator", "dall-e-3")
@@ -52,30 +74,66 @@ class ImageGenerator:
             self.logger.info("Bild-Generierung deaktiviert")
             return []
         
-        self.logger.info(f"Generiere {count} Bilder für '{keyword}'")
+        if count <= 0:
+            return []
+        
+        max_parallel = max(1, min(count, self.config.get("images.max_parallel", 3)))
+        self.logger.info(f"Generiere {count} Bilder für '{keyword}' ({max_parallel} parallel)")
+        
+        # Alle API-Aufrufe und Downloads laufen nebenläufig in einer Event-Loop
+        results = asyncio.run(self._generate_all_async(keyword, content_type, count, max_parallel))
         
         images = []
         
-        for i in range(count):
-            try:
-                # Erstelle Prompt für Bild
-                prompt = self._build_image_prompt(keyword, content_type, i + 1, count)
-                
-                # Generiere Bild
-                image_data = self._generate_single_image(prompt, keyword, i + 1)
-                
-                if image_data:
-                    images.append(image_data)
-                    self.logger.info(f"✓ Bild {i+1}/{count} generiert")
-                
-            except Exception as e:
-                self.logger.error(f"Fehler bei Bild {i+1}: {e}")
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Fehler bei Bild {i+1}: {result}")
                 continue
+            
+            if result:
+                images.append(result)
+                self.logger.info(f"✓ Bild {i+1}/{count} generiert")
         
         self.logger.info(f"✓ {len(images)} Bilder erfolgreich generiert")
         
         return images
     
+    async def _generate_all_async(
+        self,
+        keyword: str,
+        content_type: str,
+        count: int,
+        max_parallel: int
+    ) -> List:
+        """
+        Generiere alle Bilder nebenläufig
+        
+        Args:
+            keyword: Keyword
+            content_type: Content-Typ
+            count: Anzahl Bilder
+            max_parallel: Maximale Anzahl gleichzeitiger API-Aufrufe
+            
+        Returns:
+            Bild-Daten bzw. Exceptions in Bild-Reihenfolge
+        """
+        # Async-Client ist an die Event-Loop gebunden, daher pro Lauf erzeugen
+        aclient = create_async_client(self.api_key)
+        semaphore = asyncio.Semaphore(max_parallel)
+        
+        async def generate_numbered(number: int) -> Dict:
+            prompt = self._build_image_prompt(keyword, content_type, number, count)
+            async with semaphore:
+                return await self._generate_single_image_async(aclient, prompt, keyword, number)
+        
+        try:
+            return await asyncio.gather(
+                *(generate_numbered(i + 1) for i in range(count)),
+                return_exceptions=True
+            )
+        finally:
+            await aclient.close()
+    
     def _build_image_prompt(self, keyword: str, content_type: str, number: int, total: int) -> str:
         """
         Erstelle Prompt für Bild-Generierung
@@ -117,11 +175,18 @@ No text or watermarks in the image."""
         
         return prompt
     
-    def _generate_single_image(self, prompt: str, keyword: str, number: int) -> Dict:
+    async def _generate_single_image_async(
+        self,
+        aclient: AsyncOpenAI,
+        prompt: str,
+        keyword: str,
+        number: int
+    ) -> Dict:
         """
         Generiere einzelnes Bild
         
         Args:
+            aclient: Async OpenAI Client
             prompt: Bild-Prompt
             keyword: Keyword
             number: Bild-Nummer
@@ -131,7 +196,7 @@ No text or watermarks in the image."""
         """
         try:
             # Generiere mit DALL-E
-            response = self.client.images.generate(
+            response = await aclient.images.generate(
                 model=self.model,
                 prompt=prompt,
                 size=self.size,
@@ -142,8 +207,8 @@ No text or watermarks in the image."""
             # Hole Image URL
             image_url = response.data[0].url
             
-            # Download Bild
-            local_path = self._download_image(image_url, keyword, number)
+            # Download Bild (blockierendes I/O in Worker-Thread)
+            local_path = await asyncio.to_thread(self._download_image, image_url, keyword, number)
             
             # Generiere SEO-Tags
             alt_tag = self._generate_alt_tag(keyword, number)
@@ -175,7 +240,7 @@ No text or watermarks in the image."""
         """
         # Erstelle Dateinamen
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        slug = slugify(keyword)
+        slug = cached_slugify(keyword)
         filename = f"{slug}_{number}_{timestamp}.png"
         
         # Speicher-Pfad
@@ -184,11 +249,12 @@ No text or watermarks in the image."""
         
         filepath = output_dir / filename
         
-        # Download
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        
-        filepath.write_bytes(response.content)
+        # Download direkt in die Datei streamen (kein komplettes PNG im Speicher)
+        with self._http.get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(filepath, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=65536)
         
         return filepath
     
@@ -203,15 +269,7 @@ No text or watermarks in the image."""
         Returns:
             Alt-Tag
         """
-        variations = [
-            f"{keyword} - Übersicht und Informationen",
-            f"{keyword} im Detail",
-            f"Alles über {keyword}",
-            f"{keyword} - Ratgeber und Tipps",
-            f"{keyword} erklärt"
-        ]
-        
-        return variations[(number - 1) % len(variations)]
+        return self._ALT_TEMPLATES[(number - 1) % len(self._ALT_TEMPLATES)] % keyword
     
     def _generate_title_tag(self, keyword: str, number: int) -> str:
         """
@@ -224,12 +282,4 @@ No text or watermarks in the image."""
         Returns:
             Title-Tag
         """
-        variations = [
-            f"{keyword} | Professioneller Ratgeber",
-            f"{keyword} | Detaillierte Informationen",
-            f"{keyword} | Expertenwissen",
-            f"{keyword} | Umfassender Guide",
-            f"{keyword} | Alle Fakten"
-        ]
-        
-        return variations[(number - 1) % len(variations)]
+        return self._TITLE_TEMPLATES[(number - 1) % len(self._TITLE_TEMPLATES)] % keyword
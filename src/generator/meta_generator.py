@@ -4,8 +4,8 @@ Meta Generator - Generiert SEO Meta-Daten (Title, Description, H1)
 
 import os
 from typing import Dict
-from openai import OpenAI
 from src.utils.logger import get_logger
+from src.utils.openai_clients import create_client
 
 
 class MetaGenerator:
@@ -23,7 +23,7 @@ class MetaGenerator:
         
         # OpenAI Client
         api_key = os.getenv('OPENAI_API_KEY') or config.get("api_keys.openai")
-        self.client = OpenAI(api_key=api_key)
+        self.client = create_client(api_key)
         self.model = config.get("api_keys.openai_model", "gpt-4.1-mini")
     
     def generate(self, text: str, keyword: str, content_type: str) -> Dict[str, str]:
@@ -2,15 +2,95 @@
 Text Generator - KI-gestützte Textgenerierung mit OpenAI
 """
 
+import asyncio
+import hashlib
+import json
 import os
-from typing import Dict, List, Optional
-from openai import OpenAI
+import time
+from io import StringIO
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from openai import AsyncOpenAI
+from src.utils.http_cache import HTTPCache
 from src.utils.logger import get_logger
+from src.utils.openai_clients import create_async_client, create_client
+from src.utils.semantic_cache import SemanticCache
 
 
 class TextGenerator:
     """Generiert SEO-optimierte Texte mit KI-Unterstützung"""
     
+    # Prompt-Vorlagen einmalig definiert, pro Anfrage nur noch befüllt (format_map).
+    # Statische Regeln stehen vorne, variable Angaben am Ende: so bleibt der
+    # Prompt-Anfang über alle Anfragen identisch (Prompt Caching der API).
+    _GENERATION_TEMPLATE = """Du bist ein professioneller SEO-Texter für deutsche Texte. Erstelle einen hochwertigen, SEO-optimierten Text.
+
+**Tonalität:** Professionell-locker, persönliche "Du"-Anrede wo passend
+
+**SEO-Anforderungen:**
+- Keyword-Dichte: 1-3%
+- Keyword im ersten Absatz und in Überschriften
+- Kurze Sätze (max. 20 Wörter durchschnittlich)
+- Gut strukturierte Absätze (max. 100 Wörter)
+- Listen und Aufzählungen verwenden
+
+**Inhaltliche Anforderungen:**
+- Informativ und hilfreich
+- Faktenbasiert mit konkreten Informationen
+- Keine medizinischen Heilversprechen
+- Keine Slang-Begriffe
+- Professionelle Darstellung
+- Mehrwert für den Leser
+
+**Format:**
+- Schreibe in Plain Text (kein HTML)
+- Verwende Markdown für Formatierung
+- Strukturiere mit # für H1, ## für H2, ### für H3
+- Verwende **fett** für wichtige Begriffe
+- Erstelle Listen mit - oder 1., 2., 3.
+
+**Haupt-Keyword:** {keyword}
+
+**Content-Typ:** {description}
+**Ziel-Wortanzahl:** {word_count} Wörter
+**Überschriften:** {recommended_h2} H2-Überschriften, {recommended_h3} H3-Überschriften
+
+**Wichtige Themen (aus Konkurrenzanalyse):**
+{topics}
+
+**Struktur-Vorgaben:**
+{guidelines}
+
+Schreibe jetzt den vollständigen Text:"""
+    
+    _OPTIMIZATION_TEMPLATE = """Du bist ein professioneller SEO-Texter. Optimiere den folgenden Text basierend auf den Verbesserungsvorschlägen.
+
+**Optimierungs-Richtlinien:**
+- Behalte die Grundstruktur und den Inhalt bei
+- Implementiere die Verbesserungsvorschläge
+- Verbessere SEO-Optimierung (Keyword-Platzierung, Dichte)
+- Optimiere Lesbarkeit und Struktur
+- Füge fehlende Elemente hinzu (z.B. mehr H2/H3, Listen)
+- Behalte die professionell-lockere Tonalität mit "Du"-Anrede
+- Behalte Markdown-Formatierung bei
+
+**Haupt-Keyword:** {keyword}
+
+**Verbesserungsvorschläge:**
+{suggestions}
+
+**Ursprünglicher Text:**
+{text}
+
+Schreibe jetzt den optimierten Text:"""
+    
+    _FOCUS_GUIDELINES = {
+        'conversion': "Fokus auf Conversion: Vorteile hervorheben, zum Handeln motivieren",
+        'information': "Fokus auf Information: Ausführlich erklären, Mehrwert bieten",
+        'education': "Fokus auf Bildung: Schritt-für-Schritt erklären, praktische Tipps",
+        'comparison': "Fokus auf Vergleich: Objektiv vergleichen, Vor-/Nachteile aufzeigen"
+    }
+    
     def __init__(self, config):
         """
         Initialisiere Text Generator
@@ -26,8 +106,34 @@ class TextGenerator:
         if not api_key:
             raise ValueError("OpenAI API Key nicht gefunden. Bitte in config.json oder als OPENAI_API_KEY Umgebungsvariable setzen.")
         
-        self.client = OpenAI(api_key=api_key)
+        self.api_key = api_key
+        self.client = create_client(api_key)
         self.model = config.get("api_keys.openai_model", "gpt-4.1-mini")
+        
+        # Prompt-Bausteine pro Content-Typ (Konfiguration ist während eines Laufs konstant)
+        self._type_fragments: Dict[str, Tuple[str, str]] = {}
+        
+        # Exakter Cache für identische Prompts (vor dem Semantic Cache, ohne Embedding)
+        self._exact_cache: Optional[Dict[str, str]] = None
+        self.exact_disk_cache = None
+        
+        # Semantic Cache für Generierungen zu ähnlichen Keywords
+        self.prompt_cache = None
+        if config.get("cache.enabled", True):
+            cache_dir = Path(config.get("cache.directory", "data/cache"))
+            if config.get("cache.exact_enabled", True):
+                self._exact_cache = {}
+                self.exact_disk_cache = HTTPCache(
+                    str(cache_dir / "openai"),
+                    ttl_hours=config.get("cache.exact_ttl_hours", 720)
+                )
+            self.prompt_cache = SemanticCache(
+                str(cache_dir / "prompts"),
+                threshold=config.get("cache.prompt_similarity", 0.9),
+                max_entries=config.get("cache.max_entries", 500),
+                model_name=config.get("cache.embedding_model", "all-MiniLM-L6-v2"),
+                flush_interval=config.get("cache.flush_interval_ms", 5000) / 1000
+            )
     
     def generate(self, params: Dict) -> str:
         """
@@ -49,13 +155,247 @@ class TextGenerator:
         # Erstelle Prompt
         prompt = self._build_generation_prompt(keyword, content_type, competitor_data, word_count)
         
-        # Generiere Text
-        text = self._call_openai(prompt, max_tokens=3000)
+        # Generiere Text (gleiches Keyword mit identischen Vorgaben teilt sich Antworten)
+        text = self._call_openai(
+            prompt,
+            max_tokens=3000,
+            cache_key=keyword,
+            cache_scope=self._generation_cache_scope(content_type, competitor_data, word_count)
+        )
         
         self.logger.info(f"✓ Text generiert ({len(text.split())} Wörter)")
         
         return text
     
+    def generate_stream(
+        self,
+        params: Dict,
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> Iterator[str]:
+        """
+        Generiere SEO-optimierten Text als Stream
+        
+        Liefert die Textteile, sobald sie von der API eintreffen, damit
+        nachgelagerte Arbeit schon während der Generierung beginnen kann.
+        Bei einem Cache-Treffer wird der ganze Text als ein Teil geliefert.
+        
+        Args:
+            params: Generierungs-Parameter (wie bei generate)
+            on_chunk: Optionaler Callback, erhält nach jedem Teil den bisherigen Text
+            
+        Yields:
+            Textteile in Reihenfolge
+        """
+        keyword = params['keyword']
+        content_type = params['content_type']
+        competitor_data = params.get('competitor_data', {})
+        word_count = params.get('word_count', 1000)
+        
+        self.logger.info(f"Generiere Text (Stream) für '{keyword}' (Typ: {content_type}, Länge: {word_count} Wörter)")
+        
+        prompt = self._build_generation_prompt(keyword, content_type, competitor_data, word_count)
+        
+        yield from self._stream_openai(
+            prompt,
+            max_tokens=3000,
+            cache_key=keyword,
+            cache_scope=self._generation_cache_scope(content_type, competitor_data, word_count),
+            on_chunk=on_chunk
+        )
+    
+    def generate_many(self, params_list: List[Dict]) -> List[str]:
+        """
+        Generiere mehrere Texte nebenläufig
+        
+        Die Anzahl gleichzeitiger API-Aufrufe wird über batch.concurrency
+        begrenzt (Rate Limits).
+        
+        Args:
+            params_list: Liste von Generierungs-Parametern (wie bei generate)
+            
+        Returns:
+            Generierte Texte in Reihenfolge der Parameter
+        """
+        if not params_list:
+            return []
+        
+        return asyncio.run(self._generate_many_async(params_list))
+    
+    async def _generate_many_async(self, params_list: List[Dict]) -> List[str]:
+        """
+        Generiere alle Texte in einer Event-Loop
+        
+        Args:
+            params_list: Liste von Generierungs-Parametern
+            
+        Returns:
+            Generierte Texte in Reihenfolge der Parameter
+        """
+        # Async-Client ist an die Event-Loop gebunden, daher pro Lauf erzeugen
+        aclient = create_async_client(self.api_key)
+        semaphore = asyncio.Semaphore(self.config.get("batch.concurrency", 8))
+        
+        async def generate_limited(params: Dict) -> str:
+            async with semaphore:
+                return await self.generate_async(aclient, params)
+        
+        try:
+            return await asyncio.gather(*(generate_limited(params) for params in params_list))
+        finally:
+            await aclient.close()
+    
+    async def generate_async(self, aclient: AsyncOpenAI, params: Dict) -> str:
+        """
+        Generiere SEO-optimierten Text asynchron
+        
+        Args:
+            aclient: Async OpenAI Client
+            params: Generierungs-Parameter (wie bei generate)
+            
+        Returns:
+            Generierter Text
+        """
+        keyword = params['keyword']
+        content_type = params['content_type']
+        competitor_data = params.get('competitor_data', {})
+        word_count = params.get('word_count', 1000)
+        
+        self.logger.info(f"Generiere Text für '{keyword}' (Typ: {content_type}, Länge: {word_count} Wörter)")
+        
+        prompt = self._build_generation_prompt(keyword, content_type, competitor_data, word_count)
+        
+        text = await self._acall_openai(
+            aclient,
+            prompt,
+            max_tokens=3000,
+            cache_key=keyword,
+            cache_scope=self._generation_cache_scope(content_type, competitor_data, word_count)
+        )
+        
+        self.logger.info(f"✓ Text generiert für '{keyword}' ({len(text.split())} Wörter)")
+        
+        return text
+    
+    def generate_batch(self, params_list: List[Dict], batch: Optional[bool] = None) -> List[str]:
+        """
+        Generiere mehrere Texte, bei großen Jobs über die OpenAI Batch API
+        
+        Die Batch API ist günstiger, liefert aber erst nach Abschluss des
+        gesamten Jobs (bis zu 24h). Kleine Jobs laufen daher synchron.
+        
+        Args:
+            params_list: Liste von Generierungs-Parametern (wie bei generate)
+            batch: Batch API erzwingen (True) oder vermeiden (False);
+                None entscheidet anhand von batch.threshold
+            
+        Returns:
+            Generierte Texte in Reihenfolge der Parameter
+        """
+        if batch is None:
+            batch = len(params_list) >= self.config.get("batch.threshold", 50)
+        
+        if not batch:
+            return self.generate_many(params_list)
+        
+        max_tokens = 3000
+        texts: List[Optional[str]] = [None] * len(params_list)
+        requests_jsonl = []
+        
+        for index, params in enumerate(params_list):
+            prompt = self._build_generation_prompt(
+                params['keyword'],
+                params['content_type'],
+                params.get('competitor_data', {}),
+                params.get('word_count', 1000)
+            )
+            
+            # Identische Prompts nicht erneut einreichen
+            cached = self._get_exact(self._exact_key(prompt, max_tokens))
+            if cached is not None:
+                texts[index] = cached
+                continue
+            
+            requests_jsonl.append({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._request_body(prompt, max_tokens),
+                "_prompt": prompt
+            })
+        
+        if requests_jsonl:
+            self.logger.info(f"Reiche {len(requests_jsonl)} Generierungen über die Batch API ein")
+            results = self._run_batch(requests_jsonl)
+            
+            for request in requests_jsonl:
+                index = int(request['custom_id'])
+                content = results.get(request['custom_id'])
+                
+                if content is None:
+                    # Fehlgeschlagene Einzel-Anfragen synchron nachholen
+                    self.logger.warning(f"Batch-Ergebnis fehlt für '{params_list[index]['keyword']}', generiere synchron")
+                    texts[index] = self.generate(params_list[index])
+                    continue
+                
+                self._put_exact(self._exact_key(request['_prompt'], max_tokens), content)
+                texts[index] = content
+        
+        self.logger.info(f"✓ {len(texts)} Texte generiert")
+        
+        return texts
+    
+    def _run_batch(self, requests_jsonl: List[Dict]) -> Dict[str, str]:
+        """
+        Führe einen Batch-Job aus und warte auf das Ergebnis
+        
+        Args:
+            requests_jsonl: Batch-Anfragen (custom_id, method, url, body)
+            
+        Returns:
+            Dictionary custom_id -> generierter Text (nur erfolgreiche Anfragen)
+        """
+        lines = [
+            json.dumps({k: v for k, v in request.items() if not k.startswith('_')}, ensure_ascii=False)
+            for request in requests_jsonl
+        ]
+        
+        batch_file = self.client.files.create(
+            file=("batch.jsonl", '\n'.join(lines).encode('utf-8')),
+            purpose="batch"
+        )
+        job = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        
+        poll_interval = self.config.get("batch.poll_interval", 30)
+        while job.status not in ("completed", "failed", "expired", "cancelled"):
+            self.logger.debug(f"Batch {job.id}: {job.status}")
+            time.sleep(poll_interval)
+            job = self.client.batches.retrieve(job.id)
+        
+        if job.status != "completed" or not job.output_file_id:
+            raise RuntimeError(f"Batch {job.id} nicht abgeschlossen (Status: {job.status})")
+        
+        results = {}
+        output = self.client.files.content(job.output_file_id).text
+        
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            
+            item = json.loads(line)
+            response = item.get('response') or {}
+            if response.get('status_code') != 200:
+                continue
+            
+            choices = response.get('body', {}).get('choices', [])
+            if choices:
+                results[item['custom_id']] = choices[0]['message']['content'].strip()
+        
+        return results
+    
     def optimize(self, text: str, suggestions: List[str], params: Dict) -> str:
         """
         Optimiere bestehenden Text basierend auf Vorschlägen
@@ -95,59 +435,51 @@ class TextGenerator:
         Returns:
             Generierungs-Prompt
         """
-        # Hole Content-Type Config
-        type_config = self.config.get_content_type_config(content_type)
+        # Beschreibung und Struktur-Vorgaben hängen nur vom Content-Typ ab
+        description, guidelines = self._content_type_fragments(content_type)
         
         # Extrahiere Insights
         insights = competitor_data.get('insights', {})
         common_topics = insights.get('common_topics', [])
-        benchmarks = competitor_data.get('benchmarks', {})
         
         # Empfohlene Struktur
         recommended_h2 = insights.get('recommended_h2_count', 5)
         recommended_h3 = insights.get('recommended_h3_count', 3)
         
-        prompt = f"""Du bist ein professioneller SEO-Texter für deutsche Texte. Erstelle einen hochwertigen, SEO-optimierten Text.
-
-**Haupt-Keyword:** {keyword}
-
-**Content-Typ:** {type_config.get('description', content_type)}
-**Ziel-Wortanzahl:** {word_count} Wörter
-**Tonalität:** Professionell-locker, persönliche "Du"-Anrede wo passend
-
-**SEO-Anforderungen:**
-- Keyword-Dichte: 1-3%
-- Keyword im ersten Absatz und in Überschriften
-- {recommended_h2} H2-Überschriften
-- {recommended_h3} H3-Überschriften
-- Kurze Sätze (max. 20 Wörter durchschnittlich)
-- Gut strukturierte Absätze (max. 100 Wörter)
-- Listen und Aufzählungen verwenden
-
-**Wichtige Themen (aus Konkurrenzanalyse):**
-{', '.join(common_topics[:10]) if common_topics else 'Keine spezifischen Themen'}
-
-**Struktur-Vorgaben:**
-{self._get_structure_guidelines(type_config)}
-
-**Inhaltliche Anforderungen:**
-- Informativ und hilfreich
-- Faktenbasiert mit konkreten Informationen
-- Keine medizinischen Heilversprechen
-- Keine Slang-Begriffe
-- Professionelle Darstellung
-- Mehrwert für den Leser
-
-**Format:**
-- Schreibe in Plain Text (kein HTML)
-- Verwende Markdown für Formatierung
-- Strukturiere mit # für H1, ## für H2, ### für H3
-- Verwende **fett** für wichtige Begriffe
-- Erstelle Listen mit - oder 1., 2., 3.
-
-Schreibe jetzt den vollständigen Text:"""
+        return self._GENERATION_TEMPLATE.format_map({
+            'keyword': keyword,
+            'description': description,
+            'word_count': word_count,
+            'recommended_h2': recommended_h2,
+            'recommended_h3': recommended_h3,
+            'topics': ', '.join(common_topics[:10]) if common_topics else 'Keine spezifischen Themen',
+            'guidelines': guidelines
+        })
+    
+    def _generation_cache_scope(self, content_type: str, competitor_data: Dict, word_count: int) -> str:
+        """
+        Scope für den Prompt-Cache einer Generierung
+        
+        Enthält alle Vorgaben des Prompts außer dem Keyword, inklusive eines
+        Hashs der verwendeten Konkurrenz-Insights (Themen, H2/H3-Ziele).
+        
+        Args:
+            content_type: Content-Typ
+            competitor_data: Konkurrenz-Daten
+            word_count: Ziel-Wortanzahl
+            
+        Returns:
+            Cache-Scope
+        """
+        insights = competitor_data.get('insights', {})
+        insights_key = json.dumps([
+            insights.get('common_topics', [])[:10],
+            insights.get('recommended_h2_count', 5),
+            insights.get('recommended_h3_count', 3)
+        ], ensure_ascii=False)
+        insights_hash = hashlib.blake2b(insights_key.encode('utf-8'), digest_size=16).hexdigest()
         
-        return prompt
+        return f"generate|{self.model}|{content_type}|{word_count}|{insights_hash}"
     
     def _build_optimization_prompt(self, text: str, suggestions: List[str], keyword: str) -> str:
         """
@@ -163,28 +495,30 @@ Schreibe jetzt den vollständigen Text:"""
         """
         suggestions_text = '\n'.join(f"- {s}" for s in suggestions[:10])
         
-        prompt = f"""Du bist ein professioneller SEO-Texter. Optimiere den folgenden Text basierend auf den Verbesserungsvorschlägen.
-
-**Haupt-Keyword:** {keyword}
-
-**Verbesserungsvorschläge:**
-{suggestions_text}
-
-**Ursprünglicher Text:**
-{text}
-
-**Optimierungs-Richtlinien:**
-- Behalte die Grundstruktur und den Inhalt bei
-- Implementiere die Verbesserungsvorschläge
-- Verbessere SEO-Optimierung (Keyword-Platzierung, Dichte)
-- Optimiere Lesbarkeit und Struktur
-- Füge fehlende Elemente hinzu (z.B. mehr H2/H3, Listen)
-- Behalte die professionell-lockere Tonalität mit "Du"-Anrede
-- Behalte Markdown-Formatierung bei
-
-Schreibe jetzt den optimierten Text:"""
+        return self._OPTIMIZATION_TEMPLATE.format_map({
+            'keyword': keyword,
+            'suggestions': suggestions_text,
+            'text': text
+        })
+    
+    def _content_type_fragments(self, content_type: str) -> Tuple[str, str]:
+        """
+        Hole (gecachte) Prompt-Bausteine für einen Content-Typ
         
-        return prompt
+        Args:
+            content_type: Content-Typ
+            
+        Returns:
+            Tuple aus Beschreibung und Struktur-Vorgaben
+        """
+        if content_type not in self._type_fragments:
+            type_config = self.config.get_content_type_config(content_type)
+            self._type_fragments[content_type] = (
+                type_config.get('description', content_type),
+                self._get_structure_guidelines(type_config)
+            )
+        
+        return self._type_fragments[content_type]
     
     def _get_structure_guidelines(self, type_config: Dict) -> str:
         """
@@ -205,51 +539,227 @@ Schreibe jetzt den optimierten Text:"""
         if structure:
             guidelines.append(f"Strukturiere den Text in folgende Abschnitte: {', '.join(structure)}")
         
-        if focus == 'conversion':
-            guidelines.append("Fokus auf Conversion: Vorteile hervorheben, zum Handeln motivieren")
-        elif focus == 'information':
-            guidelines.append("Fokus auf Information: Ausführlich erklären, Mehrwert bieten")
-        elif focus == 'education':
-            guidelines.append("Fokus auf Bildung: Schritt-für-Schritt erklären, praktische Tipps")
-        elif focus == 'comparison':
-            guidelines.append("Fokus auf Vergleich: Objektiv vergleichen, Vor-/Nachteile aufzeigen")
+        if focus in self._FOCUS_GUIDELINES:
+            guidelines.append(self._FOCUS_GUIDELINES[focus])
         
         if cta_required:
             guidelines.append("Füge Call-to-Actions ein (z.B. 'Jetzt entdecken', 'Mehr erfahren')")
         
         return '\n'.join(f"- {g}" for g in guidelines) if guidelines else "Keine spezifischen Vorgaben"
     
-    def _call_openai(self, prompt: str, max_tokens: int = 2000) -> str:
+    def _call_openai(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        cache_key: Optional[str] = None,
+        cache_scope: Optional[str] = None
+    ) -> str:
         """
         Rufe OpenAI API auf
         
         Args:
             prompt: Prompt-Text
             max_tokens: Maximale Token-Anzahl
+            cache_key: Schlüssel für den Prompt-Cache, z.B. das Keyword (optional)
+            cache_scope: Parameter, die für einen Cache-Treffer exakt übereinstimmen müssen
             
         Returns:
             Generierter Text
         """
+        exact_key = self._exact_key(prompt, max_tokens)
+        
+        cached = self._cached_response(exact_key, cache_key, cache_scope)
+        if cached is not None:
+            return cached
+        
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "Du bist ein professioneller SEO-Texter für deutsche Texte mit Expertise in Content-Marketing und Suchmaschinenoptimierung."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=max_tokens,
-                temperature=0.7,
-                top_p=0.9
-            )
+            response = self.client.chat.completions.create(**self._request_body(prompt, max_tokens))
             
-            return response.choices[0].message.content.strip()
+            content = response.choices[0].message.content.strip()
             
         except Exception as e:
             self.logger.error(f"Fehler bei OpenAI API-Aufruf: {e}")
             raise
+        
+        self._store_response(exact_key, content, cache_key, cache_scope)
+        
+        return content
+    
+    def _stream_openai(
+        self,
+        prompt: str,
+        max_tokens: int = 2000,
+        cache_key: Optional[str] = None,
+        cache_scope: Optional[str] = None,
+        on_chunk: Optional[Callable[[str], None]] = None
+    ) -> Iterator[str]:
+        """
+        Rufe OpenAI API im Streaming-Modus auf (gleiche Caches wie _call_openai)
+        
+        Args:
+            prompt: Prompt-Text
+            max_tokens: Maximale Token-Anzahl
+            cache_key: Schlüssel für den Prompt-Cache, z.B. das Keyword (optional)
+            cache_scope: Parameter, die für einen Cache-Treffer exakt übereinstimmen müssen
+            on_chunk: Optionaler Callback, erhält nach jedem Teil den bisherigen Text
+            
+        Yields:
+            Textteile in Reihenfolge
+        """
+        exact_key = self._exact_key(prompt, max_tokens)
+        
+        cached = self._cached_response(exact_key, cache_key, cache_scope)
+        if cached is not None:
+            if on_chunk is not None:
+                on_chunk(cached)
+            yield cached
+            return
+        
+        buffer = StringIO()
+        try:
+            stream = self.client.chat.completions.create(**self._request_body(prompt, max_tokens), stream=True)
+            
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                
+                buffer.write(delta)
+                if on_chunk is not None:
+                    on_chunk(buffer.getvalue())
+                yield delta
+            
+        except Exception as e:
+            self.logger.error(f"Fehler bei OpenAI API-Aufruf: {e}")
+            raise
+        
+        # Nur vollständige Antworten cachen (wie bei _call_openai ohne Whitespace am Rand)
+        self._store_response(exact_key, buffer.getvalue().strip(), cache_key, cache_scope)
+    
+    async def _acall_openai(
+        self,
+        aclient: AsyncOpenAI,
+        prompt: str,
+        max_tokens: int = 2000,
+        cache_key: Optional[str] = None,
+        cache_scope: Optional[str] = None
+    ) -> str:
+        """
+        Rufe OpenAI API asynchron auf (gleiche Caches wie _call_openai)
+        
+        Args:
+            aclient: Async OpenAI Client
+            prompt: Prompt-Text
+            max_tokens: Maximale Token-Anzahl
+            cache_key: Schlüssel für den Prompt-Cache, z.B. das Keyword (optional)
+            cache_scope: Parameter, die für einen Cache-Treffer exakt übereinstimmen müssen
+            
+        Returns:
+            Generierter Text
+        """
+        exact_key = self._exact_key(prompt, max_tokens)
+        
+        cached = self._cached_response(exact_key, cache_key, cache_scope)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = await aclient.chat.completions.create(**self._request_body(prompt, max_tokens))
+            
+            content = response.choices[0].message.content.strip()
+            
+        except Exception as e:
+            self.logger.error(f"Fehler bei OpenAI API-Aufruf: {e}")
+            raise
+        
+        self._store_response(exact_key, content, cache_key, cache_scope)
+        
+        return content
+    
+    def _cached_response(
+        self,
+        exact_key: str,
+        cache_key: Optional[str],
+        cache_scope: Optional[str]
+    ) -> Optional[str]:
+        """Suche Antwort im exakten, dann im semantischen Cache"""
+        cached = self._get_exact(exact_key)
+        if cached is not None:
+            self.logger.info("✓ Antwort aus Cache geladen (identischer Prompt)")
+            return cached
+        
+        if self.prompt_cache is not None and cache_key is not None:
+            # Nur exakt gleiches (normalisiertes) Keyword; ähnliche Keywords werden nur protokolliert
+            cached = self.prompt_cache.get(cache_key, scope=cache_scope, exact=True)
+            if cached is not None:
+                self.logger.info("✓ Antwort aus Prompt-Cache geladen")
+                return cached
+        
+        return None
+    
+    def _store_response(
+        self,
+        exact_key: str,
+        content: str,
+        cache_key: Optional[str],
+        cache_scope: Optional[str]
+    ) -> None:
+        """Speichere Antwort in den Caches"""
+        self._put_exact(exact_key, content)
+        if self.prompt_cache is not None and cache_key is not None:
+            self.prompt_cache.put(cache_key, content, scope=cache_scope)
+    
+    def _request_body(self, prompt: str, max_tokens: int) -> Dict:
+        """
+        Erstelle Request-Parameter für Chat Completions
+        
+        Args:
+            prompt: Prompt-Text
+            max_tokens: Maximale Token-Anzahl
+            
+        Returns:
+            Request-Parameter (auch als Body für die Batch API nutzbar)
+        """
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "Du bist ein professioneller SEO-Texter für deutsche Texte mit Expertise in Content-Marketing und Suchmaschinenoptimierung."
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": max_tokens,
+            "temperature": 0.7,
+            "top_p": 0.9
+        }
+    
+    def _exact_key(self, prompt: str, max_tokens: int) -> str:
+        """Schlüssel für den exakten Cache"""
+        return hashlib.sha256(f"{self.model}|{max_tokens}|{prompt}".encode('utf-8')).hexdigest()
+    
+    def _get_exact(self, key: str) -> Optional[str]:
+        """Hole Antwort für identischen Prompt (Speicher, dann Festplatte)"""
+        if self._exact_cache is None:
+            return None
+        
+        if key in self._exact_cache:
+            return self._exact_cache[key]
+        
+        cached = self.exact_disk_cache.get(key)
+        if cached is not None:
+            self._exact_cache[key] = cached
+        return cached
+    
+    def _put_exact(self, key: str, content: str) -> None:
+        """Speichere Antwort für identischen Prompt"""
+        if self._exact_cache is None:
+            return
+        
+        self._exact_cache[key] = content
+        self.exact_disk_cache.set(key, content)
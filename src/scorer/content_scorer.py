@@ -2,13 +2,135 @@
 Content Scorer - Bewertet SEO-Content nach SISTRIX-inspirierten Metriken
 """
 
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
+import hashlib
 import re
-from bs4 import BeautifulSoup
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from lxml import etree, html as lxml_html
 from src.scorer.keyword_analyzer import KeywordAnalyzer
 from src.scorer.readability_checker import ReadabilityChecker
 from src.utils.logger import get_logger
 
+try:
+    import ahocorasick
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _AHOCORASICK_AVAILABLE = False
+
+
+# Alle Tags, die von den Teil-Scores ausgewertet werden
+_SCORED_TAGS = [
+    'title', 'meta', 'h1', 'h2', 'h3', 'ul', 'ol', 'b', 'strong', 'img', 'a',
+    'article', 'section', 'header', 'footer', 'nav', 'video', 'iframe',
+    'button', 'form'
+]
+
+# Eingabe wird immer als UTF-8 übergeben (auch bei abweichender XML-Deklaration)
+_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+# Sichtbarer Text wie bei BeautifulSoup.get_text (ohne Script-/Style-/Template-Inhalt)
+_TEXT_XPATH = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]",
+    smart_strings=False
+)
+
+# Wie _TEXT_XPATH, liefert aber Text-Knoten mit Elternbezug (nur bei <pre>/<textarea> nötig)
+_TEXT_NODES_XPATH = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+
+# In diesen Tags lässt BeautifulSoup Leerraum unverändert
+_PRESERVE_WHITESPACE_TAGS = frozenset({'pre', 'textarea'})
+
+# ASCII-Leerraum, den BeautifulSoup in reinen Leerraum-Strings zusammenfasst
+_ASCII_SPACES = str.maketrans('', '', ' \n\t\x0c\r')
+
+# Call-to-Action Begriffe als eine Alternation (ein Durchlauf über den Text)
+_CTA_RE = re.compile(r'\b(?:jetzt|hier|mehr erfahren|kaufen|bestellen|kontakt|anfrage|kostenlos)\b')
+
+_NUMBER_RE = re.compile(r'\b\d+\b')
+
+# Maximale Anzahl gemerkter Keyword-/Lesbarkeits-Analysen
+_ANALYSIS_CACHE_SIZE = 256
+
+
+def _keeps_whitespace(text_node) -> bool:
+    """Prüfe, ob ein Text-Knoten innerhalb von <pre>/<textarea> liegt"""
+    # Tail-Text gehört zum umgebenden Element, nicht zum Element davor
+    element = text_node.getparent()
+    if text_node.is_tail:
+        element = element.getparent()
+    
+    while element is not None:
+        if element.tag in _PRESERVE_WHITESPACE_TAGS:
+            return True
+        element = element.getparent()
+    
+    return False
+
+
+def _visible_text(element: lxml_html.HtmlElement) -> str:
+    """
+    Sichtbarer Text eines Elements wie BeautifulSoup.get_text()
+    
+    BeautifulSoup ersetzt Strings aus reinem ASCII-Leerraum (außerhalb von
+    <pre>/<textarea>) durch einen Zeilenumbruch bzw. ein Leerzeichen; die
+    Absatz-Erkennung über Leerzeilen hängt davon ab.
+    
+    Args:
+        element: lxml-Element
+        
+    Returns:
+        Zusammengesetzter Text
+    """
+    preserve = (
+        next(element.iter(*_PRESERVE_WHITESPACE_TAGS), None) is not None
+        or next(element.iterancestors(*_PRESERVE_WHITESPACE_TAGS), None) is not None
+    )
+    parts = []
+    
+    for text in (_TEXT_NODES_XPATH if preserve else _TEXT_XPATH)(element):
+        if not text.translate(_ASCII_SPACES) and not (preserve and _keeps_whitespace(text)):
+            text = '\n' if '\n' in text else ' '
+        parts.append(text)
+    
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=64)
+def _topic_automaton(topics: Tuple[str, ...]):
+    """Baue (gecachten) Aho-Corasick-Automaten für die Themen"""
+    automaton = ahocorasick.Automaton()
+    for topic in topics:
+        automaton.add_word(topic, topic)
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_covered_topics(topics: List[str], text_lower: str) -> int:
+    """
+    Zähle Themen, die als Teilstring im Text vorkommen
+    
+    Args:
+        topics: Themen (Kleinbuchstaben)
+        text_lower: Text in Kleinbuchstaben
+        
+    Returns:
+        Anzahl abgedeckter Themen
+    """
+    if not _AHOCORASICK_AVAILABLE:
+        return sum(1 for topic in topics if topic in text_lower)
+    
+    # Ein Durchlauf über den Text für alle Themen gleichzeitig
+    patterns = tuple(sorted({topic for topic in topics if topic}))
+    found = set()
+    if patterns:
+        found = {topic for _, topic in _topic_automaton(patterns).iter(text_lower)}
+    
+    # Leere Themen sind (wie bei "in") immer enthalten
+    return sum(1 for topic in topics if not topic or topic in found)
+
 
 class ContentScorer:
     """Bewertet Content-Qualität mit umfassendem Scoring-System"""
@@ -24,6 +146,7 @@ class ContentScorer:
         self.logger = get_logger()
         self.keyword_analyzer = KeywordAnalyzer(config)
         self.readability_checker = ReadabilityChecker(config)
+        self._analysis_cache: "OrderedDict[tuple, Dict]" = OrderedDict()
         
         # Gewichtungen aus Config
         self.weights = config.get("scoring.weights", {
@@ -48,24 +171,30 @@ class ContentScorer:
         """
         self.logger.debug(f"Berechne Content Score für Keyword: '{keyword}'")
         
-        # Parse HTML falls vorhanden
-        soup = BeautifulSoup(text, 'html.parser')
-        plain_text = soup.get_text() if text.strip().startswith('<') else text
+        # Parse HTML falls vorhanden (einmalig, direkt mit lxml ohne BeautifulSoup-Baum)
+        root = etree.fromstring(text.encode('utf-8'), _HTML_PARSER) if text.strip() else None
+        if text.strip().startswith('<'):
+            plain_text = _visible_text(root) if root is not None else ''
+        else:
+            plain_text = text
+        
+        # Alle benötigten Tags in einem einzigen Durchlauf sammeln
+        tags = self._index_tags(root)
         
         # 1. Keyword-Optimierung (20%)
-        keyword_score = self._score_keyword_optimization(text, plain_text, keyword, competitor_data)
+        keyword_score = self._score_keyword_optimization(tags, plain_text, keyword, competitor_data)
         
         # 2. Struktur & Lesbarkeit (25%)
-        structure_score = self._score_structure_readability(text, plain_text, soup)
+        structure_score = self._score_structure_readability(text, plain_text, tags)
         
         # 3. Content-Qualität (30%)
         quality_score = self._score_content_quality(plain_text, competitor_data)
         
         # 4. Technisches SEO (15%)
-        technical_score = self._score_technical_seo(text, soup, keyword)
+        technical_score = self._score_technical_seo(text, tags, keyword)
         
         # 5. Engagement-Faktoren (10%)
-        engagement_score = self._score_engagement(text, soup)
+        engagement_score = self._score_engagement(text, tags)
         
         # Berechne Gesamt-Score
         total_score = (
@@ -90,14 +219,58 @@ class ContentScorer:
         
         return result
     
-    def _score_keyword_optimization(self, text: str, plain_text: str, keyword: str, competitor_data: Dict) -> Dict:
+    def _index_tags(self, root: Optional[lxml_html.HtmlElement]) -> Dict[str, List]:
+        """
+        Sammle alle ausgewerteten Tags in einem DOM-Durchlauf
+        
+        Args:
+            root: Wurzelelement des lxml-Baums (None bei leerem Text)
+            
+        Returns:
+            Dictionary Tag-Name -> Liste der Elemente (Dokument-Reihenfolge)
+        """
+        tags = defaultdict(list)
+        if root is not None:
+            for element in root.iter(*_SCORED_TAGS):
+                tags[element.tag].append(element)
+        return tags
+    
+    def _memoized(self, plain_text: str, compute: Callable[[], Dict], *key_parts) -> Dict:
+        """
+        Hole Analyse-Ergebnis für einen Text aus dem Cache oder berechne es
+        
+        Args:
+            plain_text: Analysierter Text (als Hash Teil des Schlüssels)
+            compute: Berechnet das Ergebnis bei einem Cache-Miss
+            *key_parts: Art der Analyse und weitere Parameter
+            
+        Returns:
+            Analyse-Ergebnis
+        """
+        text_hash = hashlib.blake2b(plain_text.encode('utf-8'), digest_size=16).digest()
+        key = (*key_parts, text_hash)
+        
+        if key in self._analysis_cache:
+            self._analysis_cache.move_to_end(key)
+            return self._analysis_cache[key]
+        
+        result = compute()
+        self._analysis_cache[key] = result
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        
+        return result
+    
+    def _score_keyword_optimization(self, tags: Dict[str, List], plain_text: str, keyword: str, competitor_data: Dict) -> Dict:
         """Score: Keyword-Optimierung (20%)"""
         score = 0
         max_score = 100
         details = []
         
         # Analysiere Keywords
-        kw_analysis = self.keyword_analyzer.analyze(plain_text, keyword)
+        kw_analysis = self._memoized(
+            plain_text, lambda: self.keyword_analyzer.analyze(plain_text, keyword), 'keyword', keyword
+        )
         
         # 1. Haupt-Keyword Dichte (40 Punkte)
         target_density = competitor_data.get('benchmarks', {}).get('keyword_density', {}).get('avg', 1.5)
@@ -119,21 +292,21 @@ class ContentScorer:
         positions_score = 0
         
         # Erster Absatz
+        kw_lower = keyword.lower()
         first_paragraph = plain_text[:200].lower()
-        if keyword.lower() in first_paragraph:
+        if kw_lower in first_paragraph:
             positions_score += 10
             details.append("✓ Keyword im ersten Absatz")
         
         # H1 (falls HTML)
-        soup = BeautifulSoup(text, 'html.parser')
-        h1_tags = soup.find_all('h1')
-        if any(keyword.lower() in h1.get_text().lower() for h1 in h1_tags):
+        h1_tags = tags['h1']
+        if any(kw_lower in _visible_text(h1).lower() for h1 in h1_tags):
             positions_score += 10
             details.append("✓ Keyword in H1")
         
         # H2 Überschriften
-        h2_tags = soup.find_all('h2')
-        h2_with_kw = sum(1 for h2 in h2_tags if keyword.lower() in h2.get_text().lower())
+        h2_tags = tags['h2']
+        h2_with_kw = sum(1 for h2 in h2_tags if kw_lower in _visible_text(h2).lower())
         if h2_with_kw >= 2:
             positions_score += 10
             details.append(f"✓ Keyword in {h2_with_kw} H2-Überschriften")
@@ -164,16 +337,16 @@ class ContentScorer:
             'metrics': kw_analysis
         }
     
-    def _score_structure_readability(self, text: str, plain_text: str, soup: BeautifulSoup) -> Dict:
+    def _score_structure_readability(self, text: str, plain_text: str, tags: Dict[str, List]) -> Dict:
         """Score: Struktur & Lesbarkeit (25%)"""
         score = 0
         max_score = 100
         details = []
         
         # 1. Überschriften-Struktur (40 Punkte)
-        h1_count = len(soup.find_all('h1'))
-        h2_count = len(soup.find_all('h2'))
-        h3_count = len(soup.find_all('h3'))
+        h1_count = len(tags['h1'])
+        h2_count = len(tags['h2'])
+        h3_count = len(tags['h3'])
         
         # H1: Genau 1
         if h1_count == 1:
@@ -204,7 +377,9 @@ class ContentScorer:
             score += 7
         
         # 2. Lesbarkeit (35 Punkte)
-        readability = self.readability_checker.check(plain_text)
+        readability = self._memoized(
+            plain_text, lambda: self.readability_checker.check(plain_text), 'readability'
+        )
         
         flesch_score = readability['flesch_reading_ease']
         if flesch_score >= 60:
@@ -237,8 +412,8 @@ class ContentScorer:
                 details.append("✓ Gut strukturierte Absätze")
         
         # 3. Listen und Aufzählungen (15 Punkte)
-        ul_count = len(soup.find_all('ul'))
-        ol_count = len(soup.find_all('ol'))
+        ul_count = len(tags['ul'])
+        ol_count = len(tags['ol'])
         list_count = ul_count + ol_count
         
         if list_count >= 2:
@@ -248,7 +423,7 @@ class ContentScorer:
             score += 10
         
         # 4. Formatierung (10 Punkte)
-        bold_count = len(soup.find_all(['b', 'strong']))
+        bold_count = len(tags['b']) + len(tags['strong'])
         if bold_count >= 3:
             score += 10
             details.append("✓ Wichtige Begriffe hervorgehoben")
@@ -269,7 +444,9 @@ class ContentScorer:
         max_score = 100
         details = []
         
-        word_count = len(plain_text.split())
+        # Einmal tokenisieren, alle Wort-Metriken daraus ableiten
+        words = plain_text.split()
+        word_count = len(words)
         
         # 1. Textlänge vs. Konkurrenz (40 Punkte)
         target_word_count = competitor_data.get('insights', {}).get('recommended_word_count', 1000)
@@ -293,7 +470,7 @@ class ContentScorer:
         # Prüfe auf verschiedene Indikatoren für Tiefe
         
         # Zahlen und Fakten
-        numbers = re.findall(r'\b\d+\b', plain_text)
+        numbers = _NUMBER_RE.findall(plain_text)
         if len(numbers) >= 10:
             score += 10
             details.append(f"✓ {len(numbers)} Zahlen/Fakten")
@@ -301,12 +478,11 @@ class ContentScorer:
             score += 6
         
         # Fachbegriffe (Wörter mit Großbuchstaben oder lange Wörter)
-        words = plain_text.split()
-        complex_words = [w for w in words if len(w) > 12]
-        if len(complex_words) >= 20:
+        complex_count = sum(1 for w in words if len(w) > 12)
+        if complex_count >= 20:
             score += 10
             details.append("✓ Fachliche Tiefe erkennbar")
-        elif len(complex_words) >= 10:
+        elif complex_count >= 10:
             score += 6
         
         # Absatzanzahl (Indikator für Struktur)
@@ -321,7 +497,7 @@ class ContentScorer:
         # Einfache Heuristik: Verhältnis unique Wörter zu Gesamt
         unique_words = len(set(words))
         if words:
-            uniqueness = unique_words / len(words)
+            uniqueness = unique_words / word_count
             if uniqueness >= 0.5:
                 score += 20
                 details.append(f"✓ Hohe Wort-Diversität ({uniqueness:.1%})")
@@ -335,7 +511,7 @@ class ContentScorer:
         common_topics = competitor_data.get('insights', {}).get('common_topics', [])
         if common_topics:
             text_lower = plain_text.lower()
-            covered_topics = sum(1 for topic in common_topics[:10] if topic in text_lower)
+            covered_topics = _count_covered_topics(common_topics[:10], text_lower)
             topic_coverage = covered_topics / min(10, len(common_topics))
             
             if topic_coverage >= 0.7:
@@ -358,16 +534,17 @@ class ContentScorer:
             }
         }
     
-    def _score_technical_seo(self, text: str, soup: BeautifulSoup, keyword: str) -> Dict:
+    def _score_technical_seo(self, text: str, tags: Dict[str, List], keyword: str) -> Dict:
         """Score: Technisches SEO (15%)"""
         score = 0
         max_score = 100
         details = []
+        kw_lower = keyword.lower()
         
         # 1. Meta-Title (30 Punkte)
-        title_tag = soup.find('title')
-        if title_tag:
-            title = title_tag.get_text()
+        title_tag = tags['title'][0] if tags['title'] else None
+        if title_tag is not None:
+            title = _visible_text(title_tag)
             title_len = len(title)
             
             if 50 <= title_len <= 60:
@@ -381,16 +558,16 @@ class ContentScorer:
                 details.append(f"✗ Title-Länge suboptimal ({title_len} Zeichen)")
             
             # Keyword im Title
-            if keyword.lower() in title.lower():
+            if kw_lower in title.lower():
                 score += 10
                 details.append("✓ Keyword im Title")
         else:
             details.append("✗ Kein Title-Tag")
         
         # 2. Meta-Description (30 Punkte)
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            desc = meta_desc['content']
+        meta_desc = next((m for m in tags['meta'] if m.get('name') == 'description'), None)
+        if meta_desc is not None and meta_desc.get('content'):
+            desc = meta_desc.get('content')
             desc_len = len(desc)
             
             if 140 <= desc_len <= 160:
@@ -403,14 +580,14 @@ class ContentScorer:
                 score += 5
             
             # Keyword in Description
-            if keyword.lower() in desc.lower():
+            if kw_lower in desc.lower():
                 score += 10
                 details.append("✓ Keyword in Meta-Description")
         else:
             details.append("✗ Keine Meta-Description")
         
         # 3. Bilder mit Alt-Tags (25 Punkte)
-        images = soup.find_all('img')
+        images = tags['img']
         if images:
             images_with_alt = sum(1 for img in images if img.get('alt'))
             alt_ratio = images_with_alt / len(images)
@@ -428,11 +605,11 @@ class ContentScorer:
         
         # 4. HTML-Struktur (15 Punkte)
         # Semantische HTML5-Tags
-        semantic_tags = soup.find_all(['article', 'section', 'header', 'footer', 'nav'])
-        if len(semantic_tags) >= 2:
+        semantic_count = sum(len(tags[name]) for name in ('article', 'section', 'header', 'footer', 'nav'))
+        if semantic_count >= 2:
             score += 15
             details.append("✓ Semantisches HTML5")
-        elif len(semantic_tags) >= 1:
+        elif semantic_count >= 1:
             score += 10
         
         return {
@@ -442,20 +619,15 @@ class ContentScorer:
             'details': details
         }
     
-    def _score_engagement(self, text: str, soup: BeautifulSoup) -> Dict:
+    def _score_engagement(self, text: str, tags: Dict[str, List]) -> Dict:
         """Score: Engagement-Faktoren (10%)"""
         score = 0
         max_score = 100
         details = []
         
         # 1. Call-to-Actions (40 Punkte)
-        cta_patterns = [
-            r'\bjetzt\b', r'\bhier\b', r'\bmehr erfahren\b', r'\bkaufen\b',
-            r'\bbestellen\b', r'\bkontakt\b', r'\banfrage\b', r'\bkostenlos\b'
-        ]
-        
-        text_lower = text.lower()
-        cta_count = sum(1 for pattern in cta_patterns if re.search(pattern, text_lower))
+        # Anzahl unterschiedlicher CTA-Begriffe
+        cta_count = len(set(_CTA_RE.findall(text.lower())))
         
         if cta_count >= 3:
             score += 40
@@ -465,8 +637,8 @@ class ContentScorer:
             details.append(f"⚠ {cta_count} Call-to-Actions (mehr empfohlen)")
         
         # 2. Multimediale Elemente (30 Punkte)
-        images = len(soup.find_all('img'))
-        videos = len(soup.find_all(['video', 'iframe']))
+        images = len(tags['img'])
+        videos = len(tags['video']) + len(tags['iframe'])
         
         if images >= 3:
             score += 20
@@ -479,7 +651,7 @@ class ContentScorer:
             details.append(f"✓ {videos} Video(s)")
         
         # 3. Links (20 Punkte)
-        links = soup.find_all('a', href=True)
+        links = [a for a in tags['a'] if 'href' in a.attrib]
         if len(links) >= 5:
             score += 20
             details.append(f"✓ {len(links)} Links")
@@ -487,8 +659,8 @@ class ContentScorer:
             score += 12
         
         # 4. Interaktive Elemente (10 Punkte)
-        buttons = len(soup.find_all('button'))
-        forms = len(soup.find_all('form'))
+        buttons = len(tags['button'])
+        forms = len(tags['form'])
         
         if buttons + forms >= 1:
             score += 10
@@ -2,9 +2,56 @@
 Keyword Analyzer - Analysiert Keyword-Verwendung und semantische Relevanz
 """
 
+import heapq
 import re
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from collections import Counter
+from functools import lru_cache
+from operator import itemgetter
+
+try:
+    import ahocorasick
+    _AHOCORASICK_AVAILABLE = True
+except ImportError:
+    _AHOCORASICK_AVAILABLE = False
+
+# Wörter mit mindestens 3 Zeichen (ersetzt Sonderzeichen-Bereinigung + split + Längenfilter)
+_WORD_RE = re.compile(r'\w{3,}')
+
+# Maximale Anzahl gemeldeter Keyword-Variationen
+_MAX_VARIATIONS = 10
+
+# Deutsche Stopwörter (einmalig beim Import erzeugt)
+_STOPWORDS = frozenset({
+    'der', 'die', 'das', 'den', 'dem', 'des', 'ein', 'eine', 'einer', 'eines',
+    'und', 'oder', 'aber', 'ist', 'sind', 'war', 'waren', 'wird', 'werden',
+    'hat', 'haben', 'hatte', 'hatten', 'kann', 'können', 'konnte', 'konnten',
+    'muss', 'müssen', 'musste', 'mussten', 'soll', 'sollen', 'sollte', 'sollten',
+    'für', 'mit', 'auf', 'bei', 'von', 'zu', 'im', 'am', 'an', 'als', 'auch',
+    'nicht', 'nur', 'noch', 'mehr', 'sehr', 'wie', 'was', 'wenn', 'dass', 'weil',
+    'sich', 'sie', 'er', 'es', 'wir', 'ihr', 'ich', 'du', 'man', 'diese', 'sein',
+    'dieser', 'dieses', 'alle', 'jede', 'jeder', 'jedes', 'nach', 'über', 'vor',
+    'aus', 'durch', 'um', 'bis', 'zum', 'zur', 'beim', 'vom', 'ins', 'ans',
+    'gegen', 'ohne', 'seit', 'während', 'wegen', 'trotz', 'statt', 'außer',
+    'hier', 'da', 'dort', 'dann', 'nun', 'schon', 'noch', 'immer', 'nie',
+    'heute', 'morgen', 'gestern', 'jetzt', 'bald', 'oft', 'manchmal', 'immer'
+})
+
+
+@lru_cache(maxsize=32)
+def _parts_automaton(parts: Tuple[str, ...]):
+    """Baue (gecachten) Aho-Corasick-Automaten für die Keyword-Teile"""
+    automaton = ahocorasick.Automaton()
+    for part in parts:
+        automaton.add_word(part, part)
+    automaton.make_automaton()
+    return automaton
+
+
+@lru_cache(maxsize=32)
+def _keyword_pattern(keyword_lower: str) -> re.Pattern:
+    """Kompiliere (gecachtes) Suchmuster für alle Startpositionen des Keywords"""
+    return re.compile(f"(?={re.escape(keyword_lower)})")
 
 
 class KeywordAnalyzer:
@@ -30,17 +77,19 @@ class KeywordAnalyzer:
         Returns:
             Analyse-Ergebnisse
         """
+        # Text und Keyword nur einmal in Kleinbuchstaben umwandeln
         text_lower = text.lower()
-        words = self._tokenize(text)
+        keyword_lower = main_keyword.lower()
+        words = self._tokenize(text_lower)
         
         # Haupt-Keyword Analyse
-        main_kw_data = self._analyze_main_keyword(text_lower, words, main_keyword)
+        main_kw_data = self._analyze_main_keyword(text_lower, words, main_keyword, keyword_lower)
         
         # Verwandte Keywords
-        related_kw = self._find_related_keywords(words, main_keyword)
+        related_kw = self._find_related_keywords(words, keyword_lower)
         
         # Keyword-Positionen
-        positions = self._find_keyword_positions(text, main_keyword)
+        positions = self._find_keyword_positions(text_lower, keyword_lower)
         
         return {
             'main_keyword': main_kw_data,
@@ -49,27 +98,20 @@ class KeywordAnalyzer:
             'total_keywords': len(related_kw) + 1
         }
     
-    def _tokenize(self, text: str) -> List[str]:
+    def _tokenize(self, text_lower: str) -> List[str]:
         """
         Tokenisiere Text in Wörter
         
         Args:
-            text: Text
+            text_lower: Text in Kleinbuchstaben
             
         Returns:
             Liste von Wörtern
         """
-        # Bereinige und tokenisiere
-        text = text.lower()
-        text = re.sub(r'[^\w\s]', ' ', text)
-        words = text.split()
-        
-        # Filtere kurze Wörter
-        words = [w for w in words if len(w) > 2]
-        
-        return words
+        # Ein Durchlauf: Wortfolgen mit mehr als 2 Zeichen
+        return _WORD_RE.findall(text_lower)
     
-    def _analyze_main_keyword(self, text_lower: str, words: List[str], keyword: str) -> Dict:
+    def _analyze_main_keyword(self, text_lower: str, words: List[str], keyword: str, keyword_lower: str) -> Dict:
         """
         Analysiere Haupt-Keyword
         
@@ -77,12 +119,11 @@ class KeywordAnalyzer:
             text_lower: Text in Kleinbuchstaben
             words: Tokenisierte Wörter
             keyword: Haupt-Keyword
+            keyword_lower: Haupt-Keyword in Kleinbuchstaben
             
         Returns:
             Keyword-Daten
         """
-        keyword_lower = keyword.lower()
-        
         # Zähle Vorkommen
         count = text_lower.count(keyword_lower)
         
@@ -110,36 +151,48 @@ class KeywordAnalyzer:
             keyword: Keyword
             
         Returns:
-            Liste von Variationen
+            Liste von Variationen (max. 10, in Reihenfolge des ersten Vorkommens)
         """
-        variations = set()
         keyword_parts = keyword.split()
         
         # Wenn Keyword aus mehreren Wörtern besteht
         if len(keyword_parts) > 1:
             # Suche nach Teilwörtern
-            for part in keyword_parts:
-                if len(part) > 3:
-                    for word in words:
-                        if part in word and word != part:
-                            variations.add(word)
+            parts = tuple(sorted({part for part in keyword_parts if len(part) > 3}))
+            if not parts:
+                return []
+            
+            if _AHOCORASICK_AVAILABLE:
+                # Ein Durchlauf pro Wort für alle Teile gleichzeitig
+                automaton = _parts_automaton(parts)
+                
+                def is_variation(word: str) -> bool:
+                    return any(part != word for _, part in automaton.iter(word))
+            else:
+                def is_variation(word: str) -> bool:
+                    return any(part in word and word != part for part in parts)
         else:
             # Suche nach ähnlichen Wörtern
-            for word in words:
-                if keyword in word and word != keyword:
-                    variations.add(word)
-                elif word in keyword and len(word) > 3:
-                    variations.add(word)
+            def is_variation(word: str) -> bool:
+                return (keyword in word and word != keyword) or (word in keyword and len(word) > 3)
         
-        return list(variations)[:10]  # Limitiere auf 10
+        # Jedes Wort nur einmal prüfen, Abbruch sobald das Limit erreicht ist
+        variations = []
+        for word in dict.fromkeys(words):
+            if is_variation(word):
+                variations.append(word)
+                if len(variations) >= _MAX_VARIATIONS:
+                    break
+        
+        return variations
     
-    def _find_related_keywords(self, words: List[str], main_keyword: str) -> List[Dict]:
+    def _find_related_keywords(self, words: List[str], main_kw_lower: str) -> List[Dict]:
         """
         Finde verwandte/semantische Keywords
         
         Args:
             words: Wortliste
-            main_keyword: Haupt-Keyword
+            main_kw_lower: Haupt-Keyword in Kleinbuchstaben
             
         Returns:
             Liste verwandter Keywords mit Häufigkeit
@@ -147,83 +200,68 @@ class KeywordAnalyzer:
         # Zähle Wörter
         word_counts = Counter(words)
         
-        # Entferne Stopwörter
-        stopwords = self._get_stopwords()
+        # Zeichen des Keywords einmal für alle Kandidaten
+        main_kw_chars = frozenset(main_kw_lower)
         
-        # Filtere und sortiere
-        related = []
-        for word, count in word_counts.most_common(50):
-            # Überspringe Stopwörter und Haupt-Keyword
-            if word in stopwords or word == main_keyword.lower():
-                continue
-            
-            # Nur Wörter mit mindestens 2 Vorkommen
-            if count >= 2:
-                related.append({
-                    'keyword': word,
-                    'count': count,
-                    'relevance': self._calculate_relevance(word, main_keyword)
-                })
-        
-        # Sortiere nach Relevanz
-        related.sort(key=lambda x: x['relevance'], reverse=True)
-        
-        return related[:20]  # Top 20
+        # Alle Wörter mit mindestens 2 Vorkommen (ohne Stopwörter und Haupt-Keyword),
+        # damit häufige Füllwörter keine echten Begriffe verdrängen
+        candidates = (
+            (self._calculate_relevance(word, main_kw_lower, main_kw_chars), count, word)
+            for word, count in word_counts.items()
+            if count >= 2 and word not in _STOPWORDS and word != main_kw_lower
+        )
+        
+        # Top 20 nach Relevanz (bei Gleichstand häufigere Wörter zuerst)
+        top = heapq.nlargest(20, candidates, key=itemgetter(0, 1))
+        
+        return [
+            {'keyword': word, 'count': count, 'relevance': relevance}
+            for relevance, count, word in top
+        ]
     
-    def _calculate_relevance(self, word: str, main_keyword: str) -> float:
+    def _calculate_relevance(self, word: str, main_kw_lower: str, main_kw_chars: frozenset) -> float:
         """
         Berechne Relevanz eines Wortes zum Haupt-Keyword
         
         Args:
             word: Zu bewertendes Wort
-            main_keyword: Haupt-Keyword
+            main_kw_lower: Haupt-Keyword in Kleinbuchstaben
+            main_kw_chars: Zeichen des Haupt-Keywords
             
         Returns:
             Relevanz-Score (0-1)
         """
         # Einfache Heuristik basierend auf String-Ähnlichkeit
-        main_kw_lower = main_keyword.lower()
-        
         # Exakte Übereinstimmung mit Keyword-Teil
         if word in main_kw_lower or main_kw_lower in word:
             return 1.0
         
         # Gemeinsame Zeichen
-        common_chars = set(word) & set(main_kw_lower)
+        common_chars = main_kw_chars.intersection(word)
         similarity = len(common_chars) / max(len(word), len(main_kw_lower))
         
         return similarity
     
-    def _find_keyword_positions(self, text: str, keyword: str) -> Dict:
+    def _find_keyword_positions(self, text_lower: str, keyword_lower: str) -> Dict:
         """
         Finde Positionen des Keywords im Text
         
         Args:
-            text: Text
-            keyword: Keyword
+            text_lower: Text in Kleinbuchstaben
+            keyword_lower: Keyword in Kleinbuchstaben
             
         Returns:
             Positions-Informationen
         """
-        text_lower = text.lower()
-        keyword_lower = keyword.lower()
+        # Finde alle (auch überlappenden) Positionen in einem Regex-Durchlauf
+        positions = [m.start() for m in _keyword_pattern(keyword_lower).finditer(text_lower)]
         
-        # Finde alle Positionen
-        positions = []
-        start = 0
-        while True:
-            pos = text_lower.find(keyword_lower, start)
-            if pos == -1:
-                break
-            positions.append(pos)
-            start = pos + 1
+        # Analysiere Verteilung (Positionen sind aufsteigend sortiert)
+        text_length = len(text_lower)
         
-        # Analysiere Verteilung
-        text_length = len(text)
-        
-        in_first_100 = any(pos < 100 for pos in positions)
-        in_first_paragraph = any(pos < 500 for pos in positions)
-        in_last_paragraph = any(pos > text_length - 500 for pos in positions)
+        in_first_100 = bool(positions) and positions[0] < 100
+        in_first_paragraph = bool(positions) and positions[0] < 500
+        in_last_paragraph = bool(positions) and positions[-1] > text_length - 500
         
         return {
             'total_occurrences': len(positions),
@@ -233,19 +271,6 @@ class KeywordAnalyzer:
             'positions': positions[:10]  # Erste 10 Positionen
         }
     
-    def _get_stopwords(self) -> set:
+    def _get_stopwords(self) -> frozenset:
         """Hole deutsche Stopwörter"""
-        return {
-            'der', 'die', 'das', 'den', 'dem', 'des', 'ein', 'eine', 'einer', 'eines',
-            'und', 'oder', 'aber', 'ist', 'sind', 'war', 'waren', 'wird', 'werden',
-            'hat', 'haben', 'hatte', 'hatten', 'kann', 'können', 'konnte', 'konnten',
-            'muss', 'müssen', 'musste', 'mussten', 'soll', 'sollen', 'sollte', 'sollten',
-            'für', 'mit', 'auf', 'bei', 'von', 'zu', 'im', 'am', 'an', 'als', 'auch',
-            'nicht', 'nur', 'noch', 'mehr', 'sehr', 'wie', 'was', 'wenn', 'dass', 'weil',
-            'sich', 'sie', 'er', 'es', 'wir', 'ihr', 'ich', 'du', 'man', 'diese', 'sein',
-            'dieser', 'dieses', 'alle', 'jede', 'jeder', 'jedes', 'nach', 'über', 'vor',
-            'aus', 'durch', 'um', 'bis', 'zum', 'zur', 'beim', 'vom', 'ins', 'ans',
-            'gegen', 'ohne', 'seit', 'während', 'wegen', 'trotz', 'statt', 'außer',
-            'hier', 'da', 'dort', 'dann', 'nun', 'schon', 'noch', 'immer', 'nie',
-            'heute', 'morgen', 'gestern', 'jetzt', 'bald', 'oft', 'manchmal', 'immer'
-        }
+        return _STOPWORDS
@@ -5,6 +5,22 @@ Readability Checker - Prüft Lesbarkeit von Texten
 import re
 from typing import Dict
 
+import numpy as np
+
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+_WORD_RE = re.compile(r'\w+')
+
+# Silben ≈ Vokalgruppen; Wörter ohne Vokal zählen als eine Silbe
+_VOWELS = 'aeiouäöüy'
+
+# Lookup-Tabelle Codepoint -> Vokal (alle Vokale liegen unter U+0100)
+_VOWEL_LUT = np.zeros(max(map(ord, _VOWELS)) + 1, dtype=bool)
+_VOWEL_LUT[[ord(c) for c in _VOWELS]] = True
+
+# (U+0307 entsteht beim Kleinschreiben von 'İ' und gehört weiter zum Wort)
+_NO_VOWEL_WORD_RE = re.compile(r'(?<![\w\u0307])[^\Waeiouäöüy]+(?![\w\u0307])')
+
 
 class ReadabilityChecker:
     """Prüft und bewertet Lesbarkeit von Texten"""
@@ -33,9 +49,12 @@ class ReadabilityChecker:
         words = self._split_words(text)
         syllables = self._count_syllables(text)
         
+        # Wortlängen einmal als Array (für Durchschnitt und Komplexität)
+        word_lengths = np.fromiter(map(len, words), dtype=np.int32, count=len(words))
+        
         # Berechne Metriken
         avg_sentence_length = len(words) / len(sentences) if sentences else 0
-        avg_word_length = sum(len(w) for w in words) / len(words) if words else 0
+        avg_word_length = int(word_lengths.sum()) / len(words) if words else 0
         avg_syllables_per_word = syllables / len(words) if words else 0
         
         # Flesch Reading Ease (angepasst für Deutsch)
@@ -46,7 +65,7 @@ class ReadabilityChecker:
         )
         
         # Komplexitäts-Score
-        complexity = self._calculate_complexity(words, sentences)
+        complexity = self._calculate_complexity(words, sentences, word_lengths)
         
         return {
             'flesch_reading_ease': round(flesch, 2),
@@ -70,10 +89,9 @@ class ReadabilityChecker:
         Returns:
             Liste von Sätzen
         """
-        # Einfache Satz-Trennung
-        sentences = re.split(r'[.!?]+', text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        return sentences
+        # Einfache Satz-Trennung (split ist linear, auch bei langen Leerzeichen-Folgen)
+        sentences = _SENTENCE_SPLIT_RE.split(text)
+        return [s for s in map(str.strip, sentences) if s]
     
     def _split_words(self, text: str) -> list:
         """
@@ -85,11 +103,8 @@ class ReadabilityChecker:
         Returns:
             Liste von Wörtern
         """
-        # Entferne Sonderzeichen und teile
-        text = re.sub(r'[^\w\s]', ' ', text)
-        words = text.split()
-        words = [w for w in words if w.strip()]
-        return words
+        # Wortfolgen direkt finden statt Sonderzeichen zu ersetzen und zu teilen
+        return _WORD_RE.findall(text)
     
     def _count_syllables(self, text: str) -> int:
         """
@@ -101,38 +116,30 @@ class ReadabilityChecker:
         Returns:
             Anzahl Silben
         """
-        words = self._split_words(text)
-        total_syllables = 0
-        
-        for word in words:
-            total_syllables += self._count_word_syllables(word.lower())
-        
-        return total_syllables
+        # Vektorisiert über den ganzen Text statt einer Python-Schleife pro Zeichen
+        text_lower = text.lower()
+        return self._count_vowel_groups(text_lower) + len(_NO_VOWEL_WORD_RE.findall(text_lower))
     
-    def _count_word_syllables(self, word: str) -> int:
+    def _count_vowel_groups(self, text_lower: str) -> int:
         """
-        Zähle Silben in einem Wort (vereinfacht für Deutsch)
+        Zähle zusammenhängende Vokalgruppen im Text
         
         Args:
-            word: Wort
+            text_lower: Text in Kleinbuchstaben
             
         Returns:
-            Anzahl Silben
+            Anzahl Vokalgruppen
         """
-        # Vereinfachte Silbenzählung für Deutsch
-        # Zähle Vokale und Vokalgruppen
-        vowels = 'aeiouäöüy'
-        syllable_count = 0
-        previous_was_vowel = False
+        codes = np.frombuffer(text_lower.encode('utf-32-le'), dtype=np.uint32)
+        if codes.size == 0:
+            return 0
         
-        for char in word:
-            is_vowel = char in vowels
-            if is_vowel and not previous_was_vowel:
-                syllable_count += 1
-            previous_was_vowel = is_vowel
+        is_vowel = np.zeros(codes.size, dtype=bool)
+        in_table = codes < _VOWEL_LUT.size
+        is_vowel[in_table] = _VOWEL_LUT[codes[in_table]]
         
-        # Mindestens 1 Silbe pro Wort
-        return max(1, syllable_count)
+        # Eine Gruppe beginnt bei jedem Vokal, dem kein Vokal vorausgeht
+        return int(is_vowel[0]) + int(np.count_nonzero(is_vowel[1:] & ~is_vowel[:-1]))
     
     def _calculate_flesch_reading_ease(self, sentences: int, words: int, syllables: int) -> float:
         """
@@ -159,13 +166,14 @@ class ReadabilityChecker:
         # Normalisiere auf 0-100
         return max(0, min(100, score))
     
-    def _calculate_complexity(self, words: list, sentences: list) -> float:
+    def _calculate_complexity(self, words: list, sentences: list, word_lengths: np.ndarray) -> float:
         """
         Berechne Komplexitäts-Score
         
         Args:
             words: Wortliste
             sentences: Satzliste
+            word_lengths: Länge jedes Wortes (gleiche Reihenfolge wie words)
             
         Returns:
             Komplexitäts-Score (0-100, höher = komplexer)
@@ -176,7 +184,7 @@ class ReadabilityChecker:
         complexity = 0
         
         # Lange Wörter (> 12 Zeichen)
-        long_words = sum(1 for w in words if len(w) > 12)
+        long_words = int(np.count_nonzero(word_lengths > 12))
         long_word_ratio = long_words / len(words)
         complexity += long_word_ratio * 40
         
@@ -2,9 +2,37 @@
 Konfigurationsmanagement für den SEO Content Generator
 """
 
-import json
+import copy
+import os
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils.json_utils import dumps_bytes, loads
+
+# Geparste Konfigurationsdateien pro (Pfad, Änderungszeit)
+_CONFIG_CACHE: Dict[Tuple[Path, int], dict] = {}
+
+# Markiert im Lookup-Cache nicht vorhandene Schlüssel
+_MISSING = object()
+
+
+def _read_json(path: Path) -> dict:
+    """
+    Lese JSON-Datei, geparst wird nur einmal pro Dateiversion
+    
+    Args:
+        path: Pfad zur JSON-Datei
+        
+    Returns:
+        Eigene (tiefe) Kopie der geparsten Daten
+    """
+    resolved = path.resolve()
+    key = (resolved, resolved.stat().st_mtime_ns)
+    
+    if key not in _CONFIG_CACHE:
+        _CONFIG_CACHE[key] = loads(resolved.read_bytes())
+    
+    return copy.deepcopy(_CONFIG_CACHE[key])
 
 
 class Config:
@@ -19,6 +47,8 @@ class Config:
         """
         self.config_path = Path(config_path)
         self.config_data = self._load_config()
+        self._resolved: Dict[str, Any] = {}  # Punkt-Schlüssel -> Wert (bzw. _MISSING)
+        self._dirty = False  # Ungespeicherte Änderungen über set()
     
     def _load_config(self) -> dict:
         """Lade Konfiguration aus Datei"""
@@ -27,14 +57,14 @@ class Config:
             example_path = Path("config.example.json")
             if example_path.exists():
                 print(f"⚠️  config.json nicht gefunden, verwende {example_path}")
-                return json.loads(example_path.read_text(encoding="utf-8"))
+                return _read_json(example_path)
             else:
                 raise FileNotFoundError(
                     f"Konfigurationsdatei nicht gefunden: {self.config_path}\n"
                     "Bitte erstelle config.json basierend auf config.example.json"
                 )
         
-        return json.loads(self.config_path.read_text(encoding="utf-8"))
+        return _read_json(self.config_path)
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -47,14 +77,22 @@ class Config:
         Returns:
             Konfigurationswert oder default
         """
-        keys = key.split(".")
+        # Aufgelöste Pfade merken (ein Dict-Zugriff statt split + Baum-Durchlauf)
+        if key not in self._resolved:
+            self._resolved[key] = self._resolve(key)
+        
+        value = self._resolved[key]
+        return default if value is _MISSING else value
+    
+    def _resolve(self, key: str) -> Any:
+        """Löse Punkt-Schlüssel im Konfigurationsbaum auf (_MISSING falls nicht vorhanden)"""
         value = self.config_data
         
-        for k in keys:
+        for k in key.split("."):
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _MISSING
         
         return value
     
@@ -66,6 +104,10 @@ class Config:
             key: Schlüssel in Punkt-Notation
             value: Zu setzender Wert
         """
+        # Auch Ober- und Unterschlüssel können sich ändern
+        self._resolved.clear()
+        self._dirty = True
+        
         keys = key.split(".")
         data = self.config_data
         
@@ -77,11 +119,16 @@ class Config:
         data[keys[-1]] = value
     
     def save(self) -> None:
-        """Speichere Konfiguration zurück in Datei"""
-        self.config_path.write_text(
-            json.dumps(self.config_data, ensure_ascii=False, indent=2),
-            encoding="utf-8"
-        )
+        """Speichere Konfiguration zurück in Datei (nur bei Änderungen, atomar)"""
+        if not self._dirty and self.config_path.exists():
+            return
+        
+        # Erst in temporäre Datei schreiben, dann ersetzen (keine halb geschriebene Config)
+        tmp_path = self.config_path.with_name(f"{self.config_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(dumps_bytes(self.config_data))
+        os.replace(tmp_path, self.config_path)
+        
+        self._dirty = False
     
     def get_content_type_config(self, content_type: str) -> dict:
         """
@@ -2,12 +2,183 @@
 HTML Builder - Erstellt Bootstrap 4 HTML aus Content
 """
 
+import os
+import re
+from html import escape
+from string import Template
 from typing import Dict, List
 import markdown
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 from datetime import datetime
 from src.utils.logger import get_logger
 
+# Bootstrap-Klassen pro Element (Tabellen, Bilder, Blockquotes, Listen)
+_BOOTSTRAP_CLASSES = {
+    'table': ['table', 'table-striped', 'table-hover'],
+    'img': ['img-fluid', 'rounded', 'shadow-sm'],
+    'blockquote': ['blockquote', 'border-left', 'pl-3'],
+    'ul': ['list-unstyled', 'ml-3'],
+}
+
+# Elemente, die Bootstrap-Klassen erhalten (siehe _BOOTSTRAP_CLASSES)
+_DECORATED_TAG_RE = re.compile(r'<(?:table|img|blockquote|ul)\b', re.IGNORECASE)
+
+# Seitenvorlage einmalig beim Import erzeugt (CSS ohne doppelte Klammern)
+_PAGE_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="de">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <meta http-equiv="X-UA-Compatible" content="ie=edge">
+    
+    <!-- SEO Meta Tags -->
+    <title>$title</title>
+    <meta name="description" content="$description">
+    <meta name="keywords" content="$keyword">
+    <meta name="author" content="SEO Content Generator">
+    <meta name="robots" content="index, follow">
+    
+    <!-- Open Graph / Facebook -->
+    <meta property="og:type" content="article">
+    <meta property="og:title" content="$title">
+    <meta property="og:description" content="$description">
+    
+    <!-- Twitter -->
+    <meta property="twitter:card" content="summary_large_image">
+    <meta property="twitter:title" content="$title">
+    <meta property="twitter:description" content="$description">
+    
+    <!-- Bootstrap 4 CSS -->
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@4.6.2/dist/css/bootstrap.min.css">
+    
+    <!-- Custom Styles -->
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
+            line-height: 1.7;
+            color: #333;
+        }
+        
+        .content-wrapper {
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 40px 20px;
+        }
+        
+        h1 {
+            font-size: 2.5rem;
+            font-weight: 700;
+            margin-bottom: 1.5rem;
+            color: #1a1a1a;
+        }
+        
+        h2 {
+            font-size: 1.8rem;
+            font-weight: 600;
+            margin-top: 2.5rem;
+            margin-bottom: 1rem;
+            color: #2c3e50;
+            border-bottom: 2px solid #e9ecef;
+            padding-bottom: 0.5rem;
+        }
+        
+        h3 {
+            font-size: 1.4rem;
+            font-weight: 600;
+            margin-top: 2rem;
+            margin-bottom: 0.8rem;
+            color: #34495e;
+        }
+        
+        p {
+            margin-bottom: 1.2rem;
+            font-size: 1.05rem;
+        }
+        
+        strong {
+            font-weight: 600;
+            color: #2c3e50;
+        }
+        
+        ul, ol {
+            margin-bottom: 1.5rem;
+            padding-left: 2rem;
+        }
+        
+        li {
+            margin-bottom: 0.5rem;
+        }
+        
+        .figure {
+            margin: 2rem 0;
+        }
+        
+        .figure-img {
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        
+        .meta-info {
+            color: #6c757d;
+            font-size: 0.9rem;
+            margin-bottom: 2rem;
+            padding-bottom: 1rem;
+            border-bottom: 1px solid #e9ecef;
+        }
+        
+        .table {
+            margin: 2rem 0;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+        }
+        
+        .blockquote {
+            border-left: 4px solid #007bff;
+            background-color: #f8f9fa;
+            padding: 1rem 1.5rem;
+            margin: 1.5rem 0;
+        }
+        
+        @media (max-width: 768px) {
+            h1 {
+                font-size: 2rem;
+            }
+            h2 {
+                font-size: 1.5rem;
+            }
+            .content-wrapper {
+                padding: 20px 15px;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="content-wrapper">
+        <!-- Header -->
+        <header>
+            <h1>$h1</h1>
+            <div class="meta-info">
+                <span>📅 Erstellt am $timestamp</span> | 
+                <span>📝 Content-Typ: $content_type</span> |
+                <span>🔑 Keyword: $keyword</span>
+            </div>
+        </header>
+        
+        <!-- Main Content -->
+        <article>
+            $content_html
+        </article>
+        
+        <!-- Footer -->
+        <footer class="mt-5 pt-4 border-top text-center text-muted">
+            <p>Generiert mit SEO Content Generator | $timestamp</p>
+        </footer>
+    </div>
+    
+    <!-- Bootstrap 4 JS -->
+    <script src="https://cdn.jsdelivr.net/npm/jquery@3.5.1/dist/jquery.slim.min.js"></script>
+    <script src="https://cdn.jsdelivr.net/npm/bootstrap@4.6.2/dist/js/bootstrap.bundle.min.js"></script>
+</body>
+</html>""")
+
 
 class HTMLBuilder:
     """Baut HTML-Output mit Bootstrap 4"""
@@ -21,11 +192,17 @@ class HTMLBuilder:
         """
         self.config = config
         self.logger = get_logger()
+        
+        # Markdown-Konverter einmalig aufbauen (Extensions nicht bei jedem Aufruf laden)
+        self._markdown = markdown.Markdown(extensions=['extra', 'nl2br', 'sane_lists'])
     
     def build(self, text: str, meta_data: Dict, images: List[Dict], keyword: str, content_type: str) -> str:
         """
         Baue vollständiges HTML-Dokument
         
+        Ohne Bilder und ohne Elemente für Bootstrap-Klassen wird das
+        Markdown-HTML unverändert in die Seitenvorlage übernommen (kein Parsen).
+        
         Args:
             text: Content-Text (Markdown)
             meta_data: Meta-Daten (title, description, h1)
@@ -41,8 +218,19 @@ class HTMLBuilder:
         # Konvertiere Markdown zu HTML
         content_html = self._markdown_to_html(text)
         
-        # Integriere Bilder
-        content_html = self._integrate_images(content_html, images)
+        # Parsen nur, wenn es Bilder oder Elemente für Bootstrap-Klassen gibt
+        if images or _DECORATED_TAG_RE.search(content_html):
+            # Einmal parsen (lxml), Klassen und Bilder im selben Baum ergänzen
+            soup = BeautifulSoup(content_html, 'lxml')
+            container = soup.body if soup.body is not None else soup
+            
+            # Füge Bootstrap-Klassen hinzu
+            self._add_bootstrap_classes(container)
+            
+            # Integriere Bilder
+            self._integrate_images(container, images)
+            
+            content_html = container.decode_contents()
         
         # Baue vollständiges HTML
         html = self._build_full_html(content_html, meta_data, keyword, content_type)
@@ -61,63 +249,38 @@ class HTMLBuilder:
         Returns:
             HTML
         """
-        # Konvertiere mit Python-Markdown
-        html = markdown.markdown(
-            text,
-            extensions=['extra', 'nl2br', 'sane_lists']
-        )
-        
-        # Parse und verbessere HTML
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Füge Bootstrap-Klassen hinzu
-        soup = self._add_bootstrap_classes(soup)
-        
-        return str(soup)
+        # Konvertiere mit Python-Markdown (Zustand des vorigen Dokuments zurücksetzen)
+        return self._markdown.reset().convert(text)
     
-    def _add_bootstrap_classes(self, soup: BeautifulSoup) -> BeautifulSoup:
+    def _add_bootstrap_classes(self, soup: Tag) -> Tag:
         """
         Füge Bootstrap-Klassen zu HTML-Elementen hinzu
         
         Args:
-            soup: BeautifulSoup-Objekt
+            soup: Geparster Content (wird direkt verändert)
             
         Returns:
-            Modifiziertes BeautifulSoup-Objekt
+            Modifizierter Content
         """
-        # Tabellen
-        for table in soup.find_all('table'):
-            table['class'] = table.get('class', []) + ['table', 'table-striped', 'table-hover']
-        
-        # Bilder
-        for img in soup.find_all('img'):
-            img['class'] = img.get('class', []) + ['img-fluid', 'rounded', 'shadow-sm']
-        
-        # Blockquotes
-        for blockquote in soup.find_all('blockquote'):
-            blockquote['class'] = blockquote.get('class', []) + ['blockquote', 'border-left', 'pl-3']
-        
-        # Listen
-        for ul in soup.find_all('ul'):
-            ul['class'] = ul.get('class', []) + ['list-unstyled', 'ml-3']
+        # Ein Baumdurchlauf für alle Elementtypen
+        for element in soup.find_all(list(_BOOTSTRAP_CLASSES)):
+            element['class'] = element.get('class', []) + _BOOTSTRAP_CLASSES[element.name]
         
         return soup
     
-    def _integrate_images(self, html: str, images: List[Dict]) -> str:
+    def _integrate_images(self, soup: Tag, images: List[Dict]) -> Tag:
         """
         Integriere Bilder in HTML
         
         Args:
-            html: HTML-Content
+            soup: Geparster Content (wird direkt verändert)
             images: Bild-Daten
             
         Returns:
-            HTML mit integrierten Bildern
+            Content mit integrierten Bildern
         """
         if not images:
-            return html
-        
-        soup = BeautifulSoup(html, 'html.parser')
+            return soup
         
         # Finde alle H2-Überschriften
         h2_tags = soup.find_all('h2')
@@ -139,7 +302,7 @@ class HTMLBuilder:
                 img_soup = BeautifulSoup(img_html, 'html.parser')
                 soup.append(img_soup)
         
-        return str(soup)
+        return soup
     
     def _create_image_html(self, img_data: Dict) -> str:
         """
@@ -152,16 +315,20 @@ class HTMLBuilder:
             HTML-String
         """
         # Verwende relativen Pfad für Web
-        img_path = f"/images/banner/{Path(img_data['path']).name}"
+        img_path = f"/images/banner/{os.path.basename(img_data['path'])}"
+        
+        # Attribute einmal escapen (alt wird auch als Bildunterschrift verwendet)
+        alt = escape(img_data['alt'])
+        title = escape(img_data['title'])
         
         html = f"""
 <figure class="figure my-4">
     <img src="{img_path}" 
          class="figure-img img-fluid rounded shadow" 
-         alt="{img_data['alt']}" 
-         title="{img_data['title']}"
+         alt="{alt}" 
+         title="{title}"
          loading="lazy">
-    <figcaption class="figure-caption text-center">{img_data['alt']}</figcaption>
+    <figcaption class="figure-caption text-center">{alt}</figcaption>
 </figure>
 """
         return html
@@ -181,162 +348,12 @@ class HTMLBuilder:
         """
         timestamp = datetime.now().strftime("%d.%m.%Y")
         
-        html = f"""<!DOCTYPE html>
-<html lang="de">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta http-equiv="X-UA-Compatible" content="ie=edge">
-    
-    <!-- SEO Meta Tags -->
-    <title>{meta_data['title']}</title>
-    <meta name="description" content="{meta_data['description']}">
-    <meta name="keywords" content="{keyword}">
-    <meta name="author" content="SEO Content Generator">
-    <meta name="robots" content="index, follow">
-    
-    <!-- Open Graph / Facebook -->
-    <meta property="og:type" content="article">
-    <meta property="og:title" content="{meta_data['title']}">
-    <meta property="og:description" content="{meta_data['description']}">
-    
-    <!-- Twitter -->
-    <meta property="twitter:card" content="summary_large_image">
-    <meta property="twitter:title" content="{meta_data['title']}">
-    <meta property="twitter:description" content="{meta_data['description']}">
-    
-    <!-- Bootstrap 4 CSS -->
-    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@4.6.2/dist/css/bootstrap.min.css">
-    
-    <!-- Custom Styles -->
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-            line-height: 1.7;
-            color: #333;
-        }}
-        
-        .content-wrapper {{
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 40px 20px;
-        }}
-        
-        h1 {{
-            font-size: 2.5rem;
-            font-weight: 700;
-            margin-bottom: 1.5rem;
-            color: #1a1a1a;
-        }}
-        
-        h2 {{
-            font-size: 1.8rem;
-            font-weight: 600;
-            margin-top: 2.5rem;
-            margin-bottom: 1rem;
-            color: #2c3e50;
-            border-bottom: 2px solid #e9ecef;
-            padding-bottom: 0.5rem;
-        }}
-        
-        h3 {{
-            font-size: 1.4rem;
-            font-weight: 600;
-            margin-top: 2rem;
-            margin-bottom: 0.8rem;
-            color: #34495e;
-        }}
-        
-        p {{
-            margin-bottom: 1.2rem;
-            font-size: 1.05rem;
-        }}
-        
-        strong {{
-            font-weight: 600;
-            color: #2c3e50;
-        }}
-        
-        ul, ol {{
-            margin-bottom: 1.5rem;
-            padding-left: 2rem;
-        }}
-        
-        li {{
-            margin-bottom: 0.5rem;
-        }}
-        
-        .figure {{
-            margin: 2rem 0;
-        }}
-        
-        .figure-img {{
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        
-        .meta-info {{
-            color: #6c757d;
-            font-size: 0.9rem;
-            margin-bottom: 2rem;
-            padding-bottom: 1rem;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        
-        .table {{
-            margin: 2rem 0;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-        }}
-        
-        .blockquote {{
-            border-left: 4px solid #007bff;
-            background-color: #f8f9fa;
-            padding: 1rem 1.5rem;
-            margin: 1.5rem 0;
-        }}
-        
-        @media (max-width: 768px) {{
-            h1 {{
-                font-size: 2rem;
-            }}
-            h2 {{
-                font-size: 1.5rem;
-            }}
-            .content-wrapper {{
-                padding: 20px 15px;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="content-wrapper">
-        <!-- Header -->
-        <header>
-            <h1>{meta_data['h1']}</h1>
-            <div class="meta-info">
-                <span>📅 Erstellt am {timestamp}</span> | 
-                <span>📝 Content-Typ: {content_type}</span> |
-                <span>🔑 Keyword: {keyword}</span>
-            </div>
-        </header>
-        
-        <!-- Main Content -->
-        <article>
-            {content_html}
-        </article>
-        
-        <!-- Footer -->
-        <footer class="mt-5 pt-4 border-top text-center text-muted">
-            <p>Generiert mit SEO Content Generator | {timestamp}</p>
-        </footer>
-    </div>
-    
-    <!-- Bootstrap 4 JS -->
-    <script src="https://cdn.jsdelivr.net/npm/jquery@3.5.1/dist/jquery.slim.min.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@4.6.2/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>"""
-        
-        return html
-
-
-from pathlib import Path
+        return _PAGE_TEMPLATE.substitute(
+            title=escape(meta_data['title']),
+            description=escape(meta_data['description']),
+            h1=escape(meta_data['h1']),
+            keyword=escape(keyword),
+            content_type=escape(content_type),
+            timestamp=timestamp,
+            content_html=content_html
+        )
@@ -0,0 +1,81 @@
+"""
+HTTP Cache - Persistenter Cache für Suchergebnisse und extrahierte Seiten
+"""
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from src.utils.json_utils import dumps_bytes, loads
+from src.utils.logger import get_logger
+
+
+class HTTPCache:
+    """
+    Festplatten-Cache mit Ablaufzeit für idempotente Netzwerk-Abfragen
+    
+    Jeder Eintrag liegt als eigene JSON-Datei unter dem SHA1-Hash seines
+    Schlüssels, damit parallele Threads sich nicht gegenseitig blockieren.
+    """
+    
+    def __init__(self, directory: str, ttl_hours: float = 24):
+        """
+        Initialisiere HTTP Cache
+        
+        Args:
+            directory: Verzeichnis für Cache-Dateien
+            ttl_hours: Gültigkeitsdauer eines Eintrags in Stunden
+        """
+        self.logger = get_logger()
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_hours * 3600
+        self.directory.mkdir(parents=True, exist_ok=True)
+    
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Hole gültigen Eintrag aus dem Cache
+        
+        Args:
+            key: Schlüssel (z.B. URL oder Keyword)
+        
+        Returns:
+            Gecachter Wert oder None (fehlt oder abgelaufen)
+        """
+        path = self._path(key)
+        
+        try:
+            entry = loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.debug(f"Ungültiger Cache-Eintrag {path}: {e}")
+            return None
+        
+        if time.time() - entry.get('created', 0) > self.ttl_seconds:
+            return None
+        
+        return entry.get('value')
+    
+    def set(self, key: str, value: Any) -> None:
+        """
+        Speichere Eintrag im Cache
+        
+        Args:
+            key: Schlüssel (z.B. URL oder Keyword)
+            value: JSON-serialisierbarer Wert
+        """
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        
+        try:
+            tmp_path.write_bytes(dumps_bytes({'created': time.time(), 'value': value}, indent=False))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Cache-Eintrag konnte nicht gespeichert werden ({path}): {e}")
+    
+    def _path(self, key: str) -> Path:
+        """Dateipfad für einen Schlüssel"""
+        return self.directory / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
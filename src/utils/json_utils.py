@@ -0,0 +1,52 @@
+"""
+JSON-Hilfsfunktionen mit optionalem orjson-Backend
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def dumps_bytes(data: Any, indent: bool = True) -> bytes:
+    """
+    Serialisiere Daten als UTF-8 JSON
+    
+    Args:
+        data: Zu serialisierende Daten
+        indent: Mit 2 Leerzeichen einrücken
+        
+    Returns:
+        JSON als Bytes
+    """
+    if _ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    
+    return json.dumps(
+        data,
+        ensure_ascii=False,
+        indent=2 if indent else None
+    ).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """
+    Parse JSON aus Bytes
+    
+    Args:
+        data: JSON als Bytes
+        
+    Returns:
+        Geparste Daten
+    """
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    
+    return json.loads(data.decode("utf-8"))
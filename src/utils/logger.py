@@ -2,11 +2,101 @@
 Logging-Konfiguration für den SEO Content Generator
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Set
+
+# Bereits angelegte Log-Verzeichnisse (kein erneutes mkdir pro Logger)
+_created_log_dirs: Set[Path] = set()
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler mit großem Schreibpuffer, der periodisch statt pro Record geleert wird"""
+    
+    def __init__(self, filename, flush_interval: float = 0.25, buffer_size: int = 65536, encoding: Optional[str] = None):
+        """
+        Initialisiere gepufferten Datei-Handler
+        
+        Args:
+            filename: Pfad zur Log-Datei
+            flush_interval: Sekunden zwischen zwei Flushes
+            buffer_size: Größe des Schreibpuffers in Bytes
+            encoding: Encoding der Log-Datei
+        """
+        self.buffer_size = buffer_size
+        super().__init__(filename, encoding=encoding)
+        
+        # Hintergrund-Thread leert den Puffer, auch wenn keine neuen Records kommen
+        self._stop_flushing = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            args=(flush_interval,),
+            name="log-flush",
+            daemon=True
+        )
+        self._flusher.start()
+    
+    def _open(self):
+        """Öffne Log-Datei mit großem Puffer"""
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size, encoding=self.encoding, errors=self.errors)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Schreibe Record in den Puffer (ohne Flush pro Record)"""
+        if self.stream is None:
+            self.stream = self._open()
+        
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def close(self) -> None:
+        """Beende Flush-Thread und schreibe restlichen Puffer"""
+        self._stop_flushing.set()
+        super().close()
+    
+    def _flush_periodically(self, interval: float) -> None:
+        """Leere den Puffer im festen Intervall bis zum Schließen"""
+        while not self._stop_flushing.wait(interval):
+            self.flush()
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter für '%(asctime)s - %(name)s - %(levelname)s - %(message)s' mit sekundenweise gecachtem Zeitstempel"""
+    
+    def __init__(self):
+        """Initialisiere Formatter mit festem Format"""
+        super().__init__(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
+        # (Sekunde, formatierter Zeitstempel) als ein Tupel: Handler-Threads teilen den Formatter
+        self._cached_time = (None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Formatiere Zeitstempel, strftime nur einmal pro Sekunde"""
+        second = int(record.created)
+        cached_second, formatted = self._cached_time
+        
+        if second != cached_second:
+            formatted = time.strftime(self.datefmt, self.converter(second))
+            self._cached_time = (second, formatted)
+        
+        return formatted
+    
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Setze Zeile direkt zusammen statt über %-Interpolation des Record-Dicts"""
+        return f"{record.asctime} - {record.name} - {record.levelname} - {record.message}"
 
 
 def setup_logger(config, name: str = "seo_generator") -> logging.Logger:
@@ -16,7 +106,7 @@ def setup_logger(config, name: str = "seo_generator") -> logging.Logger:
     Args:
         config: Config-Objekt
         name: Logger-Name
-        
+    
     Returns:
         Konfigurierter Logger
     """
@@ -32,10 +122,7 @@ def setup_logger(config, name: str = "seo_generator") -> logging.Logger:
         return logger
     
     # Formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    formatter = CachedTimeFormatter()
     
     # Konsolen-Handler
     if config.get("logging.console", True):
@@ -47,23 +134,37 @@ def setup_logger(config, name: str = "seo_generator") -> logging.Logger:
     # Datei-Handler
     log_file = config.get("logging.file", "logs/seo_generator.log")
     log_path = Path(log_file)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
+    if log_path.parent not in _created_log_dirs:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        _created_log_dirs.add(log_path.parent)
     
-    file_handler = logging.FileHandler(log_path, encoding="utf-8")
+    flush_interval = config.get("logging.flush_interval_ms", 250) / 1000
+    file_handler = BufferedFileHandler(log_path, flush_interval=flush_interval, encoding="utf-8")
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
+    
+    # Datei-I/O im Hintergrund-Thread: der Aufrufer legt den Record nur in die Queue
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    logger._listener = listener
+    
+    # Restliche Records beim Beenden schreiben
+    atexit.register(listener.stop)
     
     return logger
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str = "seo_generator") -> logging.Logger:
     """
-    Hole existierenden Logger
+    Hole existierenden Logger (gecacht, pro Name gibt es genau ein Logger-Objekt)
     
     Args:
         name: Logger-Name
-        
+    
     Returns:
         Logger-Instanz
     """
@@ -0,0 +1,49 @@
+"""
+OpenAI Clients - Gemeinsame Verbindungen für alle Generatoren
+"""
+
+import importlib.util
+from functools import lru_cache
+
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+# HTTP/2 nur, wenn httpx die h2-Erweiterung laden kann
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+@lru_cache(maxsize=None)
+def _shared_http_client() -> DefaultHttpxClient:
+    """Prozessweiter HTTP-Client (Keep-Alive, TLS-Session wird wiederverwendet)"""
+    return DefaultHttpxClient(http2=_HTTP2_AVAILABLE)
+
+
+def create_client(api_key: str) -> OpenAI:
+    """
+    Erzeuge OpenAI Client auf dem gemeinsamen Verbindungs-Pool
+    
+    Text- und Meta-Generator teilen sich so eine Verbindung zur API,
+    statt für jeden Client eigene TCP-/TLS-Handshakes aufzubauen.
+    
+    Args:
+        api_key: OpenAI API Key
+    
+    Returns:
+        OpenAI Client
+    """
+    return OpenAI(api_key=api_key, http_client=_shared_http_client())
+
+
+def create_async_client(api_key: str) -> AsyncOpenAI:
+    """
+    Erzeuge Async OpenAI Client mit eigenem Verbindungs-Pool
+    
+    Async-Verbindungen sind an die Event-Loop gebunden; der Client muss
+    daher pro Lauf erzeugt und mit close() geschlossen werden.
+    
+    Args:
+        api_key: OpenAI API Key
+    
+    Returns:
+        Async OpenAI Client
+    """
+    return AsyncOpenAI(api_key=api_key, http_client=DefaultAsyncHttpxClient(http2=_HTTP2_AVAILABLE))
@@ -2,10 +2,20 @@
 Report Generator - Erstellt Reports und Dashboards
 """
 
-from typing import Dict, List
+import asyncio
+import logging
+from pathlib import Path
+from typing import BinaryIO, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime
+from src.utils.json_utils import dumps_bytes
 from src.utils.logger import get_logger
 
+# Bewertungskategorien in Report-Reihenfolge
+_SCORE_CATEGORIES = ('keyword_optimization', 'structure_readability', 'content_quality', 'technical_seo', 'engagement')
+
+# Anzeigenamen der Kategorien (z.B. "Keyword Optimization"), einmalig beim Import erzeugt
+_CATEGORY_LABELS = {category: category.replace('_', ' ').title() for category in _SCORE_CATEGORIES}
+
 
 class ReportGenerator:
     """Generiert Reports und Analytics"""
@@ -19,6 +29,9 @@ class ReportGenerator:
         """
         self.config = config
         self.logger = get_logger()
+        
+        # Level steht nach setup_logger fest; Debug-Ausgaben nur bei Bedarf anstoßen
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
     
     def generate(
         self,
@@ -28,7 +41,9 @@ class ReportGenerator:
         competitor_data: Dict,
         meta_data: Dict,
         images: List[Dict],
-        iterations: int
+        iterations: int,
+        sections: Optional[FrozenSet[str]] = None,
+        timestamp: Optional[str] = None
     ) -> Dict:
         """
         Generiere vollständigen Report
@@ -41,57 +56,45 @@ class ReportGenerator:
             meta_data: Meta-Daten
             images: Generierte Bilder
             iterations: Anzahl Optimierungs-Iterationen
+            sections: Nur diese Abschnitte erzeugen (z.B. {'metadata', 'score_breakdown'}), None = alle
+            timestamp: Erstellungszeitpunkt (ISO), z.B. gemeinsam für mehrere Reports eines Batches
             
         Returns:
             Report-Daten
         """
-        self.logger.debug("Generiere Report")
+        if self._debug_enabled:
+            self.logger.debug("Generiere Report")
         
-        timestamp = datetime.now().isoformat()
+        def wanted(section: str) -> bool:
+            return sections is None or section in sections
         
-        report = {
-            'metadata': {
+        # Nur angeforderte Abschnitte aufbauen (Reihenfolge wie im vollständigen Report)
+        report = {}
+        
+        if wanted('metadata'):
+            report['metadata'] = {
                 'keyword': keyword,
-                'generated_at': timestamp,
+                'generated_at': timestamp or datetime.now().isoformat(timespec='seconds'),
                 'iterations': iterations,
                 'final_score': score_result['total_score'],
                 'grade': score_result['grade']
-            },
-            'content_metrics': {
+            }
+        
+        if wanted('content_metrics'):
+            report['content_metrics'] = {
                 'word_count': len(final_text.split()),
                 'character_count': len(final_text),
                 'images_generated': len(images)
-            },
-            'seo_meta': meta_data,
-            'score_breakdown': {
-                'total_score': score_result['total_score'],
-                'keyword_optimization': {
-                    'score': score_result['keyword_optimization']['score'],
-                    'percentage': score_result['keyword_optimization']['percentage'],
-                    'details': score_result['keyword_optimization']['details']
-                },
-                'structure_readability': {
-                    'score': score_result['structure_readability']['score'],
-                    'percentage': score_result['structure_readability']['percentage'],
-                    'details': score_result['structure_readability']['details']
-                },
-                'content_quality': {
-                    'score': score_result['content_quality']['score'],
-                    'percentage': score_result['content_quality']['percentage'],
-                    'details': score_result['content_quality']['details']
-                },
-                'technical_seo': {
-                    'score': score_result['technical_seo']['score'],
-                    'percentage': score_result['technical_seo']['percentage'],
-                    'details': score_result['technical_seo']['details']
-                },
-                'engagement': {
-                    'score': score_result['engagement']['score'],
-                    'percentage': score_result['engagement']['percentage'],
-                    'details': score_result['engagement']['details']
-                }
-            },
-            'competitor_analysis': {
+            }
+        
+        if wanted('seo_meta'):
+            report['seo_meta'] = meta_data
+        
+        if wanted('score_breakdown'):
+            report['score_breakdown'] = self._build_score_breakdown(score_result)
+        
+        if wanted('competitor_analysis'):
+            report['competitor_analysis'] = {
                 'competitors_analyzed': competitor_data.get('competitor_count', 0),
                 'benchmarks': competitor_data.get('benchmarks', {}),
                 'insights': competitor_data.get('insights', {}),
@@ -105,8 +108,10 @@ class ReportGenerator:
                     }
                     for c in competitor_data.get('competitors', [])[:5]
                 ]
-            },
-            'images': [
+            }
+        
+        if wanted('images'):
+            report['images'] = [
                 {
                     'number': img['number'],
                     'path': img['path'],
@@ -114,50 +119,119 @@ class ReportGenerator:
                     'title': img['title']
                 }
                 for img in images
-            ],
-            'optimization_history': {
+            ]
+        
+        # Kategorien einmal bewerten (für Verbesserungen und Empfehlungen)
+        if wanted('optimization_history') or wanted('recommendations'):
+            improvements, focus_recommendations = self._evaluate_categories(score_result)
+        
+        if wanted('optimization_history'):
+            report['optimization_history'] = {
                 'iterations': iterations,
-                'improvements': self._calculate_improvements(score_result)
-            },
-            'recommendations': self._generate_recommendations(score_result, competitor_data)
-        }
+                'improvements': improvements
+            }
+        
+        if wanted('recommendations'):
+            report['recommendations'] = self._generate_recommendations(
+                score_result, competitor_data, focus_recommendations
+            )
         
-        self.logger.debug("✓ Report generiert")
+        if self._debug_enabled:
+            self.logger.debug("✓ Report generiert")
         
         return report
     
-    def _calculate_improvements(self, score_result: Dict) -> List[str]:
+    def generate_jsonl(self, writer: BinaryIO, **kwargs) -> None:
+        """
+        Generiere Report und hänge ihn als eine JSON-Zeile an (für Batch-Läufe)
+        
+        Args:
+            writer: Binärer, gepufferter Ausgabestrom (z.B. open(path, 'ab'), über viele Reports wiederverwendet)
+            **kwargs: Argumente wie bei generate()
+        """
+        # Kompakt serialisieren (orjson falls installiert), Report wird nicht zurückgegeben
+        writer.write(dumps_bytes(self.generate(**kwargs), indent=False) + b"\n")
+    
+    async def generate_async(self, **kwargs) -> Dict:
+        """
+        Generiere Report in einem Worker-Thread (blockiert den Event-Loop nicht)
+        
+        Args:
+            **kwargs: Argumente wie bei generate()
+            
+        Returns:
+            Report-Daten
+        """
+        return await asyncio.to_thread(self.generate, **kwargs)
+    
+    async def write_report_async(self, path: Path, report: Dict) -> None:
         """
-        Berechne Verbesserungen
+        Serialisiere und speichere Report in einem Worker-Thread
+        
+        Args:
+            path: Zielpfad (JSON)
+            report: Report-Daten
+        """
+        await asyncio.to_thread(lambda: Path(path).write_bytes(dumps_bytes(report)))
+    
+    def _build_score_breakdown(self, score_result: Dict) -> Dict:
+        """
+        Baue Score-Aufschlüsselung pro Kategorie
         
         Args:
             score_result: Scoring-Ergebnis
             
         Returns:
-            Liste von Verbesserungen
+            Gesamt-Score und Score/Prozent/Details je Kategorie
+        """
+        breakdown = {'total_score': score_result['total_score']}
+        
+        for category in _SCORE_CATEGORIES:
+            # Kategorie nur einmal nachschlagen
+            cat_data = score_result[category]
+            breakdown[category] = {
+                'score': cat_data['score'],
+                'percentage': cat_data['percentage'],
+                'details': cat_data['details']
+            }
+        
+        return breakdown
+    
+    def _evaluate_categories(self, score_result: Dict) -> Tuple[List[str], List[str]]:
+        """
+        Bewerte alle Kategorien in einem Durchlauf
+        
+        Args:
+            score_result: Scoring-Ergebnis
+            
+        Returns:
+            Verbesserungen und kategorie-spezifische Empfehlungen
         """
         improvements = []
+        focus_recommendations = []
         
-        for category in ['keyword_optimization', 'structure_readability', 'content_quality', 'technical_seo', 'engagement']:
-            cat_data = score_result.get(category, {})
-            percentage = cat_data.get('percentage', 0)
+        for category in _SCORE_CATEGORIES:
+            percentage = score_result.get(category, {}).get('percentage', 0)
+            label = _CATEGORY_LABELS[category]
             
             if percentage >= 80:
-                improvements.append(f"✓ {category.replace('_', ' ').title()}: Exzellent ({percentage:.1f}%)")
+                improvements.append(f"✓ {label}: Exzellent ({percentage:.1f}%)")
             elif percentage >= 70:
-                improvements.append(f"✓ {category.replace('_', ' ').title()}: Gut ({percentage:.1f}%)")
+                improvements.append(f"✓ {label}: Gut ({percentage:.1f}%)")
             else:
-                improvements.append(f"⚠ {category.replace('_', ' ').title()}: Verbesserungspotential ({percentage:.1f}%)")
+                improvements.append(f"⚠ {label}: Verbesserungspotential ({percentage:.1f}%)")
+                focus_recommendations.append(f"🔧 Fokus auf {label}")
         
-        return improvements
+        return improvements, focus_recommendations
     
-    def _generate_recommendations(self, score_result: Dict, competitor_data: Dict) -> List[str]:
+    def _generate_recommendations(self, score_result: Dict, competitor_data: Dict, focus_recommendations: List[str]) -> List[str]:
         """
         Generiere Empfehlungen
         
         Args:
             score_result: Scoring-Ergebnis
             competitor_data: Konkurrenz-Daten
+            focus_recommendations: Kategorie-spezifische Empfehlungen (aus _evaluate_categories)
             
         Returns:
             Liste von Empfehlungen
@@ -174,12 +248,7 @@ class ReportGenerator:
             recommendations.append("⚠ Content benötigt weitere Optimierung.")
         
         # Kategorie-spezifische Empfehlungen
-        for category in ['keyword_optimization', 'structure_readability', 'content_quality', 'technical_seo', 'engagement']:
-            cat_data = score_result.get(category, {})
-            percentage = cat_data.get('percentage', 0)
-            
-            if percentage < 70:
-                recommendations.append(f"🔧 Fokus auf {category.replace('_', ' ').title()}")
+        recommendations.extend(focus_recommendations)
         
         # Konkurrenz-Vergleich
         benchmarks = competitor_data.get('benchmarks', {})
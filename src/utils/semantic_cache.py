@@ -0,0 +1,339 @@
+"""
+Semantic Cache - Wiederverwendung von Ergebnissen für ähnliche Anfragen
+"""
+
+import atexit
+import copy
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.utils.json_utils import dumps_bytes, loads
+from src.utils.logger import get_logger
+
+try:
+    from sentence_transformers import SentenceTransformer
+    _EMBEDDINGS_AVAILABLE = True
+except ImportError:
+    _EMBEDDINGS_AVAILABLE = False
+
+try:
+    import faiss
+    _FAISS_AVAILABLE = True
+except ImportError:
+    _FAISS_AVAILABLE = False
+
+
+_WS_RE = re.compile(r'\s+')
+
+
+class SemanticCache:
+    """
+    Persistenter LRU-Cache mit Ähnlichkeitssuche über Satz-Embeddings
+    
+    Ohne sentence-transformers werden nur exakte Treffer auf dem
+    normalisierten Schlüssel gefunden.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        threshold: float = 0.87,
+        max_entries: int = 500,
+        model_name: str = "all-MiniLM-L6-v2",
+        flush_interval: float = 5.0
+    ):
+        """
+        Initialisiere Semantic Cache
+        
+        Args:
+            path: Basis-Pfad für Persistenz (ohne Endung)
+            threshold: Minimale Kosinus-Ähnlichkeit für einen Treffer
+            max_entries: Maximale Anzahl Einträge (LRU-Verdrängung)
+            model_name: Name des Embedding-Modells
+            flush_interval: Mindestabstand zwischen zwei Schreibvorgängen in Sekunden
+                (ausstehende Änderungen werden beim Beenden geschrieben)
+        """
+        self.logger = get_logger()
+        self.path = Path(path)
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model_name = model_name
+        self.flush_interval = flush_interval
+        self._model = None
+        self._dimension: Optional[int] = None  # Dimension der gespeicherten Embeddings
+        self._dirty = False  # Ungespeicherte Änderungen über put()
+        self._last_save = time.monotonic()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # Schlüssel -> (Embedding, Wert, Scope)
+        self._indexes: Dict[Optional[str], Tuple[List[str], Any]] = {}  # Scope -> (Schlüssel, Suchindex)
+        
+        self._load()
+        
+        # Restliche Änderungen beim Beenden schreiben
+        atexit.register(self.flush)
+    
+    def get(self, key: str, scope: Optional[str] = None, exact: bool = False) -> Optional[Any]:
+        """
+        Suche gecachten Wert für Schlüssel
+        
+        Args:
+            key: Anfrage-Schlüssel (z.B. Keyword)
+            scope: Optionaler Geltungsbereich; nur Einträge mit exakt
+                gleichem Scope kommen als (ähnliche) Treffer in Frage
+            exact: Nur den normalisierten Schlüssel selbst als Treffer werten;
+                ähnliche Einträge werden lediglich protokolliert (Debug)
+        
+        Returns:
+            Gecachter Wert (eigene Kopie) oder None
+        """
+        norm_key = self._normalize(key)
+        entry_key = self._entry_key(norm_key, scope)
+        
+        # Exakter Treffer ohne Embedding-Kosten
+        if entry_key in self._entries:
+            self._entries.move_to_end(entry_key)
+            return copy.deepcopy(self._entries[entry_key][1])
+        
+        # Ähnlichkeitssuche nur für Treffer oder Debug-Ausgabe
+        if exact and not self.logger.isEnabledFor(logging.DEBUG):
+            return None
+        
+        embedding = self._embed(norm_key)
+        if embedding is None or not self._entries:
+            return None
+        
+        keys, index = self._get_index(scope)
+        if not keys:
+            return None
+        
+        best, similarity = self._search(index, embedding)
+        
+        if similarity < self.threshold:
+            return None
+        
+        match_key = keys[best].rpartition('\x1f')[2]
+        if exact:
+            self.logger.debug(f"Semantic Cache: ähnlicher Eintrag nicht verwendet: '{key}' ≈ '{match_key}' ({similarity:.2f})")
+            return None
+        
+        self.logger.debug(f"Semantic Cache Treffer: '{key}' ≈ '{match_key}' ({similarity:.2f})")
+        self._entries.move_to_end(keys[best])
+        return copy.deepcopy(self._entries[keys[best]][1])
+    
+    def put(self, key: str, value: Any, scope: Optional[str] = None) -> None:
+        """
+        Speichere Wert im Cache
+        
+        Geschrieben wird höchstens alle flush_interval Sekunden (siehe flush).
+        
+        Args:
+            key: Anfrage-Schlüssel
+            value: JSON-serialisierbarer Wert
+            scope: Optionaler Geltungsbereich (siehe get)
+        """
+        norm_key = self._normalize(key)
+        entry_key = self._entry_key(norm_key, scope)
+        self._entries[entry_key] = (self._embed(norm_key), copy.deepcopy(value), scope)
+        self._entries.move_to_end(entry_key)
+        self._indexes.pop(scope, None)
+        
+        while len(self._entries) > self.max_entries:
+            _, (_, _, evicted_scope) = self._entries.popitem(last=False)
+            self._indexes.pop(evicted_scope, None)
+        
+        self._dirty = True
+        if time.monotonic() - self._last_save >= self.flush_interval:
+            self.flush()
+    
+    def flush(self) -> None:
+        """Schreibe ausstehende Änderungen auf die Festplatte"""
+        if not self._dirty:
+            return
+        
+        self._save()
+        self._dirty = False
+        self._last_save = time.monotonic()
+    
+    def _get_index(self, scope: Optional[str]) -> Tuple[List[str], Any]:
+        """
+        Hole (oder baue) den Suchindex für einen Scope
+        
+        Der Index wird nur nach Änderungen in diesem Scope neu aufgebaut,
+        statt die Embedding-Matrix bei jeder Anfrage neu zu stapeln.
+        
+        Args:
+            scope: Geltungsbereich
+        
+        Returns:
+            Tuple aus Schlüsseln (in Index-Reihenfolge) und Suchindex
+        """
+        if scope in self._indexes:
+            return self._indexes[scope]
+        
+        keys = [
+            k for k, (e, _, s) in self._entries.items()
+            if e is not None and s == scope
+        ]
+        index = None
+        if keys:
+            matrix = np.ascontiguousarray(np.stack([self._entries[k][0] for k in keys]), dtype=np.float32)
+            if _FAISS_AVAILABLE:
+                index = faiss.IndexFlatIP(matrix.shape[1])
+                index.add(matrix)
+            else:
+                index = self._quantize(matrix)
+        
+        self._indexes[scope] = (keys, index)
+        return keys, index
+    
+    def _search(self, index: Any, embedding: np.ndarray) -> Tuple[int, float]:
+        """Position und Kosinus-Ähnlichkeit des nächsten Nachbarn"""
+        if _FAISS_AVAILABLE:
+            sims, ids = index.search(embedding.reshape(1, -1), 1)
+            return int(ids[0, 0]), float(sims[0, 0])
+        
+        matrix, scales = index
+        query, query_scale = self._quantize(embedding)
+        sims = np.matmul(matrix, query, dtype=np.int32) * (scales * query_scale)
+        best = int(np.argmax(sims))
+        return best, float(sims[best])
+    
+    @staticmethod
+    def _quantize(vectors: np.ndarray) -> Tuple[np.ndarray, Any]:
+        """
+        Quantisiere Embeddings symmetrisch auf int8 (Skala pro Vektor)
+        
+        Args:
+            vectors: Einzelnes Embedding oder Matrix (ein Embedding pro Zeile)
+        
+        Returns:
+            Tuple aus int8-Werten und Skalierungsfaktor(en)
+        """
+        scales = np.abs(vectors).max(axis=-1, keepdims=True) / 127
+        scales[scales == 0] = 1.0
+        quantized = np.round(vectors / scales).astype(np.int8)
+        return quantized, scales.squeeze(-1).astype(np.float32)
+    
+    def _normalize(self, key: str) -> str:
+        """Normalisiere Schlüssel (Kleinschreibung, Whitespace)"""
+        return _WS_RE.sub(' ', key.lower()).strip()
+    
+    def _entry_key(self, norm_key: str, scope: Optional[str]) -> str:
+        """Interner Schlüssel aus Scope und normalisiertem Schlüssel"""
+        return norm_key if scope is None else f"{scope}\x1f{norm_key}"
+    
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Berechne normalisiertes Embedding (falls verfügbar)"""
+        if not _EMBEDDINGS_AVAILABLE:
+            return None
+        
+        if self._model is None:
+            self._model = SentenceTransformer(self.model_name)
+        
+        embedding = np.asarray(self._model.encode(text, normalize_embeddings=True), dtype=np.float32)
+        self._check_dimension(embedding.shape[-1])
+        return embedding
+    
+    def _check_dimension(self, dimension: int) -> None:
+        """Verwerfe Embeddings mit anderer Dimension (nicht vergleichbar, Suchindex würde scheitern)"""
+        if self._dimension == dimension:
+            return
+        
+        if self._dimension is not None:
+            self.logger.warning(
+                f"Embedding-Dimension geändert ({self._dimension} → {dimension}), "
+                f"verwerfe Einträge mit alten Embeddings"
+            )
+            for key in [k for k, (e, _, _) in self._entries.items() if e is not None]:
+                del self._entries[key]
+            self._indexes.clear()
+            self._dirty = True
+        
+        self._dimension = dimension
+    
+    def _load(self) -> None:
+        """Lade Cache von Festplatte (Warmstart)"""
+        store_path = self.path.with_suffix('.npz')
+        
+        if not store_path.exists():
+            return
+        
+        try:
+            with np.load(store_path, allow_pickle=False) as store:
+                metadata = loads(store['metadata'].tobytes())
+                embeddings = store['embeddings']
+            
+            data = metadata['entries']
+            
+            # Embedding-Zeilen müssen exakt zu den Einträgen passen, sonst wäre jeder Treffer falsch zugeordnet
+            indexes = sorted(item['embedding_index'] for item in data if item.get('has_embedding'))
+            if indexes != list(range(len(embeddings))):
+                raise ValueError(
+                    f"{len(embeddings)} Embeddings für {len(indexes)} Einträge mit Embedding"
+                )
+            
+            # Embeddings eines anderen Modells (oder anderer Dimension) sind nicht vergleichbar
+            compatible = (
+                metadata.get('model') == self.model_name
+                and (not len(embeddings) or embeddings.shape[1] == metadata.get('dimension'))
+            )
+            if compatible:
+                self._dimension = metadata.get('dimension')
+            elif len(embeddings):
+                self.logger.info(
+                    f"Verwerfe {len(embeddings)} Cache-Einträge des Embedding-Modells "
+                    f"'{metadata.get('model')}' ({store_path})"
+                )
+            
+            for item in data:
+                embedding = None
+                if item.get('has_embedding'):
+                    if not compatible:
+                        continue
+                    embedding = embeddings[item['embedding_index']]
+                self._entries[item['key']] = (embedding, item['value'], item.get('scope'))
+        except Exception as e:
+            self.logger.warning(f"Cache konnte nicht geladen werden, wird verworfen ({store_path}): {e}")
+            self._entries.clear()
+        
+        self._indexes.clear()
+    
+    def _save(self) -> None:
+        """Speichere Einträge und Embeddings gemeinsam in einer Datei (atomar ersetzt)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        data = []
+        embeddings = []
+        for key, (embedding, value, scope) in self._entries.items():
+            item = {'key': key, 'value': value, 'has_embedding': embedding is not None}
+            if scope is not None:
+                item['scope'] = scope
+            if embedding is not None:
+                item['embedding_index'] = len(embeddings)
+                embeddings.append(embedding)
+            data.append(item)
+        
+        matrix = np.stack(embeddings) if embeddings else np.zeros((0, 0), dtype=np.float32)
+        metadata = {
+            'model': self.model_name,
+            'dimension': matrix.shape[1] if embeddings else None,
+            'entries': data
+        }
+        metadata_bytes = np.frombuffer(dumps_bytes(metadata, indent=False), dtype=np.uint8)
+        
+        store_path = self.path.with_suffix('.npz')
+        tmp_path = store_path.with_name(f"{store_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        
+        try:
+            with open(tmp_path, 'wb') as f:
+                np.savez(f, metadata=metadata_bytes, embeddings=matrix)
+            os.replace(tmp_path, store_path)
+        except OSError as e:
+            self.logger.warning(f"Cache konnte nicht gespeichert werden ({store_path}): {e}")
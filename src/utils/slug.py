@@ -0,0 +1,21 @@
+"""
+Slug-Erzeugung für Datei- und Verzeichnisnamen
+"""
+
+from functools import lru_cache
+
+from slugify import slugify
+
+
+@lru_cache(maxsize=1024)
+def cached_slugify(text: str) -> str:
+    """
+    Erzeuge Slug mit Cache für wiederkehrende Keywords
+    
+    Args:
+        text: Zu konvertierender Text
+        
+    Returns:
+        URL-/Dateinamen-tauglicher Slug
+    """
+    return slugify(text)
@@ -0,0 +1,45 @@
+"""
+Regressionstests: vektorisierter Struktur-Score entspricht der skalaren Bewertung
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from src.analyzer.content_extractor import ContentExtractor
+from src.utils.config import Config
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.example.json"
+
+
+@pytest.fixture(scope="module")
+def extractor() -> ContentExtractor:
+    config = Config(str(CONFIG_PATH))
+    config.set("cache.enabled", False)
+    return ContentExtractor(config)
+
+
+def _random_page(rng: random.Random) -> dict:
+    """Seite mit Werten um alle Schwellen des Struktur-Scores"""
+    images = [{'src': 'x.jpg', 'alt': rng.choice(['', 'Bild'])} for _ in range(rng.randint(0, 7))]
+    return {
+        'title': 'T' * rng.choice([0, 1, 49, 50, 55, 60, 61]),
+        'meta_description': 'D' * rng.choice([0, 1, 139, 140, 150, 160, 161]),
+        'h1': ['H1'] * rng.randint(0, 3),
+        'headings': {'h2': ['H2'] * rng.randint(0, 4), 'h3': ['H3'] * rng.randint(0, 3)},
+        'word_count': rng.choice([0, 299, 300, 499, 500, 999, 1000, 5000]),
+        'images': images,
+        'links': {'total': rng.randint(0, 2)}
+    }
+
+
+def test_batch_scores_match_scalar_scores(extractor):
+    rng = random.Random(11)
+    pages = [_random_page(rng) for _ in range(2000)]
+    
+    expected = [extractor._calculate_structure_score(page) for page in pages]
+    
+    assert extractor.calculate_structure_scores(pages) == expected
+    assert extractor.calculate_structure_scores(pages[:1]) == expected[:1]
+    assert extractor.calculate_structure_scores([]) == []
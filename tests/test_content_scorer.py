@@ -0,0 +1,116 @@
+"""
+Regressionstests: lxml-Textextraktion im ContentScorer entspricht BeautifulSoup.get_text()
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+from bs4 import BeautifulSoup
+from lxml import etree
+
+from src.scorer import content_scorer
+from src.scorer.content_scorer import ContentScorer
+from src.utils.config import Config
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.example.json"
+
+COMPETITOR_DATA = {
+    'benchmarks': {'keyword_density': {'avg': 1.5}},
+    'insights': {
+        'recommended_word_count': 600,
+        'common_topics': ['hund', 'katze', 'futter', 'gesundheit', 'ernährung']
+    }
+}
+
+WORDS = (
+    "Hundefutter Hund Katze Futter jetzt hier kaufen kostenlos Kontakt mehr erfahren "
+    "Gesundheitsvorsorge 12 2024 Ernährungsberatung und der die das ist gut. Sehr! Wirklich?"
+).split()
+
+# Fragmente mit Leerraum zwischen Block-Elementen, <pre>/<textarea>, Kommentaren und Skripten
+FRAGMENTS = [
+    '<p>Text eins</p>', '\n\n', '\n', '  ', '\t \n ',
+    '<h2>Titel <b>x</b>\n\n<i>y</i></h2>',
+    '<pre>  a\n\n  <b>b</b>\n\n</pre>',
+    '<textarea>\n\n x \n</textarea>',
+    '<!-- c -->',
+    '<script>var a = "\\n\\n";</script>',
+    '<style>\n</style>',
+    '<ul>\n<li>a</li>\n\n<li>b</li>\n</ul>',
+    'Freitext ', '&nbsp;\n', '<div> \n\n</div>', '<br>',
+    '<table>\n<tr>\n<td>z</td>\n</tr>\n</table>',
+    '<template>\n\nx</template>',
+]
+
+WRAPPERS = [
+    '<html><head><title>T</title></head>\n<body>\n{}\n</body>\n</html>',
+    '<!DOCTYPE html>\n<html>\n<head>\n<title> T\n</title>\n</head>\n<body>{}</body></html>',
+    '<div>{}</div>',
+    '<p>a</p>\n\n{}',
+]
+
+
+def _sentence(rng: random.Random) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(5, 80)))
+
+
+def _fragment_documents(count: int = 300):
+    rng = random.Random(5)
+    for _ in range(count):
+        body = ''.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 15)))
+        yield rng.choice(WRAPPERS).format(body)
+
+
+def _article_documents(count: int = 60):
+    """Formatierte Artikel (Zeilenumbrüche zwischen Blöcken wie beim HTML-Builder)"""
+    rng = random.Random(7)
+    for _ in range(count):
+        sections = []
+        for _ in range(rng.randint(1, 10)):
+            heading = ("Hundefutter " if rng.random() < 0.5 else "") + _sentence(rng)[:20]
+            sections.append(f"<h2>{heading}</h2>\n\n<p>{_sentence(rng)}</p>\n")
+            if rng.random() < 0.5:
+                sections.append("<ul>\n<li>a</li>\n<li>b</li>\n</ul>\n")
+        yield (
+            "<!DOCTYPE html>\n<html>\n<head>\n"
+            f"    <title>Hundefutter {_sentence(rng)[:40]}</title>\n"
+            f'    <meta name="description" content="{_sentence(rng)[:150]}">\n'
+            "</head>\n<body>\n<article>\n<h1>Hundefutter kaufen</h1>\n\n"
+            + "\n".join(sections)
+            + "</article>\n</body>\n</html>"
+        )
+
+
+FRAGMENT_CASES = [pytest.param(html, id=f"fragment-{i}") for i, html in enumerate(_fragment_documents())]
+ARTICLE_CASES = [pytest.param(html, id=f"article-{i}") for i, html in enumerate(_article_documents())]
+
+
+@pytest.fixture(scope="module")
+def scorer() -> ContentScorer:
+    return ContentScorer(Config(str(CONFIG_PATH)))
+
+
+@pytest.mark.parametrize("html", FRAGMENT_CASES + ARTICLE_CASES)
+def test_visible_text_matches_beautifulsoup(html):
+    root = etree.fromstring(html.encode('utf-8'), content_scorer._HTML_PARSER)
+    soup = BeautifulSoup(html, 'lxml')
+    
+    assert content_scorer._visible_text(root) == soup.get_text()
+    
+    for tag in ('title', 'h1', 'h2', 'li', 'pre'):
+        expected = [element.get_text() for element in soup.find_all(tag)]
+        assert [content_scorer._visible_text(element) for element in root.iter(tag)] == expected
+
+
+@pytest.mark.parametrize("html", ARTICLE_CASES)
+def test_paragraph_scores_match_beautifulsoup_text(scorer, html):
+    result = scorer.score(html, 'Hundefutter', COMPETITOR_DATA)
+    
+    # Referenz: Teil-Scores auf Basis des Textes, den BeautifulSoup liefert
+    plain_text = BeautifulSoup(html, 'lxml').get_text()
+    root = etree.fromstring(html.encode('utf-8'), content_scorer._HTML_PARSER)
+    tags = scorer._index_tags(root)
+    
+    assert result['content_quality'] == scorer._score_content_quality(plain_text, COMPETITOR_DATA)
+    assert result['structure_readability'] == scorer._score_structure_readability(html, plain_text, tags)